@@ -3,10 +3,14 @@ FastAPI Backend for Content Verification Tool
 """
 
 import os
+import hashlib
+import time
+import zlib
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List
+from fastapi.middleware.gzip import GZipMiddleware
+from typing import Dict, List, Optional
 from pathlib import Path
 import logging
 import tempfile
@@ -15,6 +19,8 @@ from termcolor import cprint
 
 from app.models import (
     UploadResponse,
+    UploadChunkResponse,
+    CompleteUploadRequest,
     ChunkingRequest,
     ChunkingResponse,
     ExportRequest,
@@ -23,6 +29,8 @@ from app.models import (
     ChunkingMode,
     OutputFormat,
     UploadReferencesResponse,
+    ReferenceChunkResponse,
+    FinalizeReferencesRequest,
     VerificationRequest,
     VerificationResponse,
 )
@@ -32,6 +40,7 @@ from app.processing import (
     output_generator,
     document_cache,
 )
+from app.processing.document_processor import MAX_FILE_SIZE
 from app.corpus import corpus_manager
 from app.verification import gemini_verifier
 
@@ -64,10 +73,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses for clients that accept gzip (CSV/JSON exports shrink 5-10x)
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
 # In-memory storage for processed documents
 # In production, use Redis or a database
 DOCUMENT_STORE: Dict[str, dict] = {}
 
+# SHA-256 content digest -> document_id, lets clients skip re-uploading known files
+DOCUMENT_DIGESTS: Dict[str, str] = {}
+
+# Documents being received in chunks: upload_id -> staging info
+DOCUMENT_UPLOADS: Dict[str, dict] = {}
+
+# Reference documents being received in chunks: upload_id -> staging info
+REFERENCE_UPLOADS: Dict[str, dict] = {}
+
+# Seconds a chunked upload may sit unfinished before its staged file is discarded
+CHUNKED_UPLOAD_TTL = int(os.getenv("CHUNKED_UPLOAD_TTL", "3600"))
+
+
+def decode_upload_content(file_content: bytes, content_encoding: Optional[str]) -> bytes:
+    """
+    Decode an upload body that the client compressed before sending
+
+    Args:
+        file_content: Raw bytes received for the uploaded file
+        content_encoding: Encoding applied by the client (None or "gzip")
+
+    Returns:
+        Original file bytes
+
+    Raises:
+        ValueError: If the encoding is unsupported, the data is corrupt, or the
+            decoded file exceeds the maximum upload size
+    """
+    if not content_encoding or content_encoding == "identity":
+        return file_content
+
+    if content_encoding != "gzip":
+        raise ValueError(f"Unsupported content encoding: {content_encoding}")
+
+    # Bound decompression by the upload limit so a small body can't expand unchecked
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        decoded = decompressor.decompress(file_content, MAX_FILE_SIZE + 1)
+    except zlib.error as e:
+        raise ValueError(f"Corrupt gzip upload: {e}")
+
+    if len(decoded) > MAX_FILE_SIZE or decompressor.unconsumed_tail:
+        raise ValueError(
+            f"Decompressed file exceeds maximum allowed size "
+            f"({MAX_FILE_SIZE / 1024 / 1024:.2f} MB)"
+        )
+
+    cprint(
+        f"[API] Decompressed upload: {len(file_content)} -> {len(decoded)} bytes",
+        "cyan",
+    )
+    return decoded
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -111,13 +177,163 @@ async def health_check():
     }
 
 
+def store_document(file_content: bytes, filename: str) -> UploadResponse:
+    """
+    Convert document content with Docling and keep it in the document store
+
+    Args:
+        file_content: Original (decoded) file bytes
+        filename: Original filename
+
+    Returns:
+        UploadResponse with document metadata
+    """
+    # Process document with Docling
+    result = document_processor.convert_document(
+        file_content=file_content, filename=filename, use_cache=True
+    )
+
+    # Generate document ID (use hash of file content)
+    document_id = hashlib.md5(file_content).hexdigest()
+    content_digest = hashlib.sha256(file_content).hexdigest()
+
+    # Store document data
+    DOCUMENT_STORE[document_id] = {
+        "docling_document": result["docling_document"],
+        "filename": result["filename"],
+        "page_count": result["page_count"],
+        "file_size": result["file_size"],
+        "chunks_cache": {},  # Cache chunks by mode
+    }
+    DOCUMENT_DIGESTS[content_digest] = document_id
+
+    cprint(f"[API] Document stored with ID: {document_id}", "green")
+
+    return UploadResponse(
+        document_id=document_id,
+        filename=result["filename"],
+        page_count=result["page_count"],
+        file_size=result["file_size"],
+        message=f"Document uploaded and converted successfully ({result['page_count']} pages)",
+    )
+
+
+def stage_upload_chunk(
+    uploads: Dict[str, dict],
+    upload_id: str,
+    filename: str,
+    offset: int,
+    total: int,
+    chunk_content: bytes,
+) -> int:
+    """
+    Write one chunk of a chunked upload into its temp file at the chunk's offset
+
+    Parts may arrive in any order, so concurrent senders need no coordination.
+
+    Args:
+        uploads: Staging table the upload belongs to
+        upload_id: Client-generated identifier for this file's upload
+        filename: Original filename
+        offset: Byte offset of this chunk within the file
+        total: Total file size in bytes
+        chunk_content: Chunk bytes
+
+    Returns:
+        Bytes received so far for this upload
+    """
+    if total > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds maximum allowed size ({MAX_FILE_SIZE / 1024 / 1024:.2f} MB)",
+        )
+
+    if offset < 0 or offset + len(chunk_content) > total:
+        raise HTTPException(status_code=400, detail="Chunk outside file bounds")
+
+    staged = uploads.get(upload_id)
+    if staged is None:
+        sweep_expired_uploads()
+        temp_file = tempfile.NamedTemporaryFile(
+            delete=False, suffix=Path(filename).suffix
+        )
+        temp_file.close()
+        staged = {
+            "path": temp_file.name,
+            "filename": filename,
+            "total": total,
+            "chunks": {},
+            "started_at": time.time(),
+        }
+        uploads[upload_id] = staged
+        cprint(f"[API] Started chunked upload: {filename} ({total} bytes)", "cyan")
+    elif staged["total"] != total:
+        raise HTTPException(status_code=400, detail="Chunk total does not match upload")
+
+    with open(staged["path"], "r+b") as f:
+        f.seek(offset)
+        f.write(chunk_content)
+    staged["chunks"][offset] = len(chunk_content)
+
+    return sum(staged["chunks"].values())
+
+
+def discard_staged_upload(uploads: Dict[str, dict], upload_id: str) -> None:
+    """Forget a staged chunked upload and delete its temp file"""
+    staged = uploads.pop(upload_id, None)
+    if staged is not None:
+        Path(staged["path"]).unlink(missing_ok=True)
+
+
+def sweep_expired_uploads() -> None:
+    """
+    Discard chunked uploads that were abandoned before being finalized
+
+    Runs whenever a new chunked upload starts, so staged temp files from
+    clients that gave up mid-upload don't accumulate on disk.
+    """
+    cutoff = time.time() - CHUNKED_UPLOAD_TTL
+    for uploads in (DOCUMENT_UPLOADS, REFERENCE_UPLOADS):
+        expired = [uid for uid, staged in uploads.items() if staged["started_at"] < cutoff]
+        for upload_id in expired:
+            cprint(
+                f"[API] Discarded abandoned upload: {uploads[upload_id]['filename']}",
+                "yellow",
+            )
+            discard_staged_upload(uploads, upload_id)
+
+
+def upload_is_complete(staged: dict) -> bool:
+    """
+    Check that a staged upload's chunks cover the file exactly
+
+    Byte counts alone can't tell overlapping chunks from a full file, so the
+    chunks must tile [0, total) end to end with no gaps or overlaps.
+
+    Args:
+        staged: Staging info with "total" and an offset -> length "chunks" map
+
+    Returns:
+        True if every byte of the file has been received exactly once
+    """
+    covered = 0
+    for offset in sorted(staged["chunks"]):
+        if offset != covered:
+            return False
+        covered += staged["chunks"][offset]
+    return covered == staged["total"]
+
+
 @app.post("/upload", response_model=UploadResponse)
-async def upload_document(file: UploadFile = File(...)):
+async def upload_document(
+    file: UploadFile = File(...), content_encoding: Optional[str] = Form(None)
+):
     """
     Upload and convert document using Docling
 
     Args:
         file: Uploaded PDF or DOCX file
+        content_encoding: Compression applied to the file part by the client (optional)
 
     Returns:
         UploadResponse with document metadata
@@ -128,36 +344,83 @@ async def upload_document(file: UploadFile = File(...)):
         # Read file content
         file_content = await file.read()
         cprint(f"[API] Read {len(file_content)} bytes from {file.filename}", "cyan")
+        file_content = decode_upload_content(file_content, content_encoding)
+
+        return store_document(file_content, file.filename)
 
-        # Process document with Docling
-        result = document_processor.convert_document(
-            file_content=file_content, filename=file.filename, use_cache=True
+    except ValueError as e:
+        cprint(f"[API] Validation error: {e}", "red")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        cprint(f"[API] Error processing upload: {e}", "red")
+        raise HTTPException(
+            status_code=500, detail=f"Error processing document: {str(e)}"
         )
 
-        # Generate document ID (use hash of file content)
-        import hashlib
 
-        document_id = hashlib.md5(file_content).hexdigest()
+@app.post("/upload/chunk", response_model=UploadChunkResponse)
+async def upload_document_chunk(
+    upload_id: str = Form(...),
+    filename: str = Form(...),
+    offset: int = Form(...),
+    total: int = Form(...),
+    chunk: UploadFile = File(...),
+):
+    """
+    Receive one part of a document sent in chunks
 
-        # Store document data
-        DOCUMENT_STORE[document_id] = {
-            "docling_document": result["docling_document"],
-            "filename": result["filename"],
-            "page_count": result["page_count"],
-            "file_size": result["file_size"],
-            "chunks_cache": {},  # Cache chunks by mode
-        }
+    Args:
+        upload_id: Client-generated identifier for this document's upload
+        filename: Original filename
+        offset: Byte offset of this part within the (possibly compressed) upload
+        total: Total upload size in bytes
+        chunk: Part bytes
 
-        cprint(f"[API] Document stored with ID: {document_id}", "green")
+    Returns:
+        UploadChunkResponse with bytes received so far
+    """
+    chunk_content = await chunk.read()
+    received = stage_upload_chunk(
+        DOCUMENT_UPLOADS, upload_id, filename, offset, total, chunk_content
+    )
+    return UploadChunkResponse(
+        upload_id=upload_id, received_bytes=received, total_bytes=total
+    )
+
+
+@app.post("/upload/complete", response_model=UploadResponse)
+async def complete_document_upload(request: CompleteUploadRequest):
+    """
+    Convert a document once every part of its chunked upload has arrived
+
+    Args:
+        request: CompleteUploadRequest with the upload ID and content encoding
 
-        return UploadResponse(
-            document_id=document_id,
-            filename=result["filename"],
-            page_count=result["page_count"],
-            file_size=result["file_size"],
-            message=f"Document uploaded and converted successfully ({result['page_count']} pages)",
+    Returns:
+        UploadResponse with document metadata
+    """
+    staged = DOCUMENT_UPLOADS.get(request.upload_id)
+    if staged is None:
+        raise HTTPException(status_code=404, detail="Unknown upload ID")
+
+    cprint(
+        f"\n[API] Received upload completion: {staged['filename']}", "cyan", attrs=["bold"]
+    )
+
+    if not upload_is_complete(staged):
+        discard_staged_upload(DOCUMENT_UPLOADS, request.upload_id)
+        raise HTTPException(
+            status_code=400, detail=f"Incomplete upload: {staged['filename']}"
         )
 
+    # The staged file is kept until conversion succeeds, so a failed completion
+    # can be repeated instead of answering 404
+    try:
+        file_content = Path(staged["path"]).read_bytes()
+        file_content = decode_upload_content(file_content, request.content_encoding)
+
+        result = store_document(file_content, staged["filename"])
+
     except ValueError as e:
         cprint(f"[API] Validation error: {e}", "red")
         raise HTTPException(status_code=400, detail=str(e))
@@ -167,6 +430,92 @@ async def upload_document(file: UploadFile = File(...)):
             status_code=500, detail=f"Error processing document: {str(e)}"
         )
 
+    discard_staged_upload(DOCUMENT_UPLOADS, request.upload_id)
+    return result
+
+
+@app.get("/upload/{content_digest}", response_model=UploadResponse)
+async def lookup_uploaded_document(content_digest: str):
+    """
+    Look up a previously uploaded document by its SHA-256 content digest
+
+    Args:
+        content_digest: Hex SHA-256 digest of the original file content
+
+    Returns:
+        UploadResponse for the stored document (404 if unknown)
+    """
+    cprint(f"\n[API] Received upload lookup: {content_digest[:12]}...", "cyan")
+
+    document_id = DOCUMENT_DIGESTS.get(content_digest)
+    if document_id is None or document_id not in DOCUMENT_STORE:
+        cprint("[API] No stored document for digest - full upload required", "yellow")
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    doc_data = DOCUMENT_STORE[document_id]
+    cprint(f"[API] ✓ Reusing stored document: {document_id}", "green")
+
+    return UploadResponse(
+        document_id=document_id,
+        filename=doc_data["filename"],
+        page_count=doc_data["page_count"],
+        file_size=doc_data["file_size"],
+        message=f"Document already uploaded ({doc_data['page_count']} pages)",
+    )
+
+
+def process_reference_files(
+    staged_files: List[tuple], case_context: Optional[str]
+) -> UploadReferencesResponse:
+    """
+    Create a File Search store and upload staged reference files to it
+
+    Args:
+        staged_files: List of (temp_file_path, original_filename) tuples
+        case_context: Context about the verification case (optional)
+
+    Returns:
+        UploadReferencesResponse with store information and metadata
+    """
+    # Generate a case ID
+    case_id = hashlib.md5(f"{case_context or 'default'}{time.time()}".encode()).hexdigest()[:8]
+
+    # Create File Search store
+    store_name, display_name = corpus_manager.create_store(case_id)
+    cprint(f"[API] Created store: {store_name}", "green")
+
+    # Process each file
+    metadata_list = []
+
+    for idx, (file_path, filename) in enumerate(staged_files):
+        cprint(
+            f"[API] Processing file {idx + 1}/{len(staged_files)}: {filename}", "cyan"
+        )
+
+        try:
+            # Use optimized upload method (single upload for both metadata and store)
+            metadata, _ = corpus_manager.upload_reference_with_metadata(
+                file_path=file_path,
+                filename=filename,
+                store_name=store_name,
+                case_context=case_context,
+            )
+            metadata_list.append(metadata)
+            cprint(f"[API] ✓ Uploaded {filename} to store (optimized)", "green")
+
+        except Exception as e:
+            cprint(f"[API] ✗ Error processing {filename}: {e}", "red")
+            # Continue with other files
+
+    cprint(f"[API] Reference upload complete: {len(metadata_list)} documents", "green")
+
+    return UploadReferencesResponse(
+        store_id=store_name,
+        store_name=display_name,
+        documents_uploaded=len(metadata_list),
+        metadata=metadata_list,
+    )
+
 
 @app.post("/api/verify/upload-references", response_model=UploadReferencesResponse)
 async def upload_references(
@@ -192,68 +541,110 @@ async def upload_references(
     else:
         cprint("[API] No case context provided", "cyan")
 
-    try:
-        # Generate a case ID
-        import hashlib
-        import time
-
-        case_id = hashlib.md5(f"{case_context or 'default'}{time.time()}".encode()).hexdigest()[:8]
-
-        # Create File Search store
-        store_name, display_name = corpus_manager.create_store(case_id)
-        cprint(f"[API] Created store: {store_name}", "green")
+    staged_files = []
 
-        # Process each file
-        metadata_list = []
-        temp_files = []
-
-        for idx, file in enumerate(files):
-            cprint(
-                f"[API] Processing file {idx + 1}/{len(files)}: {file.filename}", "cyan"
-            )
-
-            # Save file temporarily
+    try:
+        # Save files temporarily
+        for file in files:
             file_content = await file.read()
             temp_file = tempfile.NamedTemporaryFile(
                 delete=False, suffix=Path(file.filename).suffix
             )
             temp_file.write(file_content)
             temp_file.close()
-            temp_files.append(temp_file.name)
-
-            try:
-                # Use optimized upload method (single upload for both metadata and store)
-                metadata, _ = corpus_manager.upload_reference_with_metadata(
-                    file_path=temp_file.name,
-                    filename=file.filename,
-                    store_name=store_name,
-                    case_context=case_context,
-                )
-                metadata_list.append(metadata)
-                cprint(
-                    f"[API] ✓ Uploaded {file.filename} to store (optimized)", "green"
-                )
-
-            except Exception as e:
-                cprint(f"[API] ✗ Error processing {file.filename}: {e}", "red")
-                # Continue with other files
+            staged_files.append((temp_file.name, file.filename))
 
+        return process_reference_files(staged_files, case_context)
+
+    except ValueError as e:
+        cprint(f"[API] Validation error: {e}", "red")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        cprint(f"[API] Error uploading references: {e}", "red")
+        raise HTTPException(
+            status_code=500, detail=f"Error uploading references: {str(e)}"
+        )
+    finally:
         # Clean up temp files
-        for temp_file in temp_files:
-            try:
-                Path(temp_file).unlink()
-            except:
-                pass
+        for temp_file, _ in staged_files:
+            Path(temp_file).unlink(missing_ok=True)
 
-        cprint(
-            f"[API] Reference upload complete: {len(metadata_list)} documents", "green"
+
+@app.post(
+    "/api/verify/upload-references/chunk", response_model=ReferenceChunkResponse
+)
+async def upload_reference_chunk(
+    upload_id: str = Form(...),
+    filename: str = Form(...),
+    offset: int = Form(...),
+    total: int = Form(...),
+    chunk: UploadFile = File(...),
+):
+    """
+    Receive one chunk of a reference document for a chunked upload
+
+    Chunks are written at their offset, so a chunk that failed in transit can be
+    re-sent without restarting the file.
+
+    Args:
+        upload_id: Client-generated identifier for this file's upload
+        filename: Original filename
+        offset: Byte offset of this chunk within the file
+        total: Total file size in bytes
+        chunk: Chunk bytes
+
+    Returns:
+        ReferenceChunkResponse with bytes received so far
+    """
+    chunk_content = await chunk.read()
+    received = stage_upload_chunk(
+        REFERENCE_UPLOADS, upload_id, filename, offset, total, chunk_content
+    )
+    return ReferenceChunkResponse(
+        upload_id=upload_id, received_bytes=received, total_bytes=total
+    )
+
+
+@app.post(
+    "/api/verify/upload-references/finalize", response_model=UploadReferencesResponse
+)
+async def finalize_reference_upload(request: FinalizeReferencesRequest):
+    """
+    Create a File Search store from reference documents sent in chunks
+
+    Args:
+        request: FinalizeReferencesRequest with upload IDs and case context
+
+    Returns:
+        UploadReferencesResponse with store information and metadata
+    """
+    cprint(
+        f"\n[API] Received reference finalize request: {len(request.upload_ids)} files",
+        "cyan",
+        attrs=["bold"],
+    )
+
+    missing = [uid for uid in request.upload_ids if uid not in REFERENCE_UPLOADS]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Unknown upload IDs: {missing}")
+
+    staged = [REFERENCE_UPLOADS[uid] for uid in request.upload_ids]
+
+    incomplete = [item["filename"] for item in staged if not upload_is_complete(item)]
+    if incomplete:
+        # The client restarts a failed batch with new upload IDs, so drop all of it
+        for uid in request.upload_ids:
+            discard_staged_upload(REFERENCE_UPLOADS, uid)
+        raise HTTPException(
+            status_code=400, detail=f"Incomplete uploads: {', '.join(incomplete)}"
         )
 
-        return UploadReferencesResponse(
-            store_id=store_name,
-            store_name=display_name,
-            documents_uploaded=len(metadata_list),
-            metadata=metadata_list,
+    # Staged files are kept until the store is built, so a failed finalize can be
+    # repeated with the same upload IDs instead of answering 404
+    try:
+        result = process_reference_files(
+            [(item["path"], item["filename"]) for item in staged],
+            request.case_context,
         )
 
     except ValueError as e:
@@ -265,6 +656,10 @@ async def upload_references(
             status_code=500, detail=f"Error uploading references: {str(e)}"
         )
 
+    for uid in request.upload_ids:
+        discard_staged_upload(REFERENCE_UPLOADS, uid)
+    return result
+
 
 @app.post("/api/verify/execute", response_model=VerificationResponse)
 async def execute_verification(request: VerificationRequest):
@@ -285,8 +680,6 @@ async def execute_verification(request: VerificationRequest):
     cprint(f"[API] Store ID: {request.store_id}", "cyan")
     cprint(f"[API] Splitting mode: {request.splitting_mode.value}", "cyan")
 
-    import time
-
     start_time = time.time()
 
     try:
@@ -624,6 +1017,7 @@ async def clear_cache():
     try:
         document_cache.clear_all()
         DOCUMENT_STORE.clear()
+        DOCUMENT_DIGESTS.clear()
 
         return {"message": "Cache cleared successfully", "documents_cleared": 0}
 
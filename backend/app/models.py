@@ -78,6 +78,23 @@ class UploadResponse(BaseModel):
     message: str = Field(..., description="Status message")
 
 
+class UploadChunkResponse(BaseModel):
+    """Response from uploading one part of a document sent in chunks"""
+
+    upload_id: str = Field(..., description="Chunked upload identifier")
+    received_bytes: int = Field(..., description="Bytes received so far for this file")
+    total_bytes: int = Field(..., description="Total upload size in bytes")
+
+
+class CompleteUploadRequest(BaseModel):
+    """Request to convert a document whose parts were all uploaded in chunks"""
+
+    upload_id: str = Field(..., description="Chunked upload identifier")
+    content_encoding: Optional[str] = Field(
+        None, description="Compression applied to the whole file by the client (optional)"
+    )
+
+
 class ChunkingRequest(BaseModel):
     """Request to chunk a document"""
 
@@ -178,6 +195,21 @@ class UploadReferencesResponse(BaseModel):
     )
 
 
+class ReferenceChunkResponse(BaseModel):
+    """Response from uploading one chunk of a reference document"""
+
+    upload_id: str = Field(..., description="Chunked upload identifier")
+    received_bytes: int = Field(..., description="Bytes received so far for this file")
+    total_bytes: int = Field(..., description="Total file size in bytes")
+
+
+class FinalizeReferencesRequest(BaseModel):
+    """Request to create a corpus from reference documents uploaded in chunks"""
+
+    upload_ids: List[str] = Field(..., description="Chunked upload identifiers, one per file")
+    case_context: Optional[str] = Field(None, description="Context about the verification case (optional)")
+
+
 class VerificationRequest(BaseModel):
     """Request to verify chunks against reference documents"""
 
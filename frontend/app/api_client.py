@@ -2,10 +2,16 @@
 API Client for Content Verification Tool Backend
 """
 
+import gzip
+import hashlib
+import math
+import uuid
 import requests
 import streamlit as st
 import logging
-from typing import Optional, Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Tuple, Callable
 from urllib.parse import quote
 from termcolor import cprint
 from requests.adapters import HTTPAdapter
@@ -17,17 +23,33 @@ from .config import (
     UPLOAD_TIMEOUT_BASE,
     EXPORT_TIMEOUT,
     DOWNLOAD_TIMEOUT,
+    REFERENCE_CHUNK_SIZE,
+    REFERENCE_UPLOAD_WORKERS,
+    DOCUMENT_CHUNK_SIZE,
+    DOCUMENT_UPLOAD_WORKERS,
     HEALTH_CHECK_TIMEOUT,
+    UPLOAD_COMPRESSION_MIN_BYTES,
+    UPLOAD_COMPRESSION_LEVEL,
+    UPLOAD_COMPRESSION_MAX_ENTROPY,
+    UPLOAD_COMPRESSION_SAMPLE_BYTES,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def get_session_with_retries() -> requests.Session:
+class BackendError(Exception):
+    """Backend call failed; the message is ready to show to the user
+
+    Raised instead of calling st.error by calls that run on a worker thread,
+    where Streamlit elements have no script context and render nothing.
+    """
+
+
+def get_session_with_retries(retries: int = 3) -> requests.Session:
     """Create requests session with retry strategy"""
     session = requests.Session()
     retry_strategy = Retry(
-        total=3,
+        total=retries,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "POST"],
@@ -38,8 +60,35 @@ def get_session_with_retries() -> requests.Session:
     return session
 
 
-# Create API session at module level
-API_SESSION = get_session_with_retries()
+@st.cache_resource
+def get_api_session() -> requests.Session:
+    """Process-wide API session, kept across reruns and module reloads
+
+    Holds no per-user state, so every session and upload thread shares one
+    keep-alive connection pool to the backend.
+    """
+    return get_session_with_retries()
+
+
+@st.cache_resource
+def get_health_session() -> requests.Session:
+    """Process-wide health-check session - no retries so an offline backend fails fast"""
+    return get_session_with_retries(retries=0)
+
+
+@st.cache_resource
+def get_finalize_session() -> requests.Session:
+    """Process-wide session for finalize calls - no retries
+
+    A retried finalize would repeat work the backend may already have done, such
+    as building a File Search store.
+    """
+    return get_session_with_retries(retries=0)
+
+
+API_SESSION = get_api_session()
+HEALTH_SESSION = get_health_session()
+FINALIZE_SESSION = get_finalize_session()
 
 
 def calculate_upload_timeout(file_size_mb: float) -> int:
@@ -48,6 +97,32 @@ def calculate_upload_timeout(file_size_mb: float) -> int:
     return max(UPLOAD_TIMEOUT_BASE, size_based_timeout)
 
 
+def sample_entropy(file_content: bytes) -> float:
+    """Shannon entropy (bits/byte) of a window from the middle of the file"""
+    start = max(0, len(file_content) // 2 - UPLOAD_COMPRESSION_SAMPLE_BYTES // 2)
+    sample = file_content[start : start + UPLOAD_COMPRESSION_SAMPLE_BYTES]
+    if not sample:
+        return 0.0
+    total = len(sample)
+    return -sum(
+        (count / total) * math.log2(count / total)
+        for count in Counter(sample).values()
+    )
+
+
+def compress_upload(file_content: bytes) -> Tuple[bytes, Optional[str]]:
+    """Gzip upload bytes when it is likely to pay off, returning (payload, encoding)"""
+    if len(file_content) < UPLOAD_COMPRESSION_MIN_BYTES:
+        return file_content, None
+    if sample_entropy(file_content) > UPLOAD_COMPRESSION_MAX_ENTROPY:
+        return file_content, None
+
+    compressed = gzip.compress(file_content, compresslevel=UPLOAD_COMPRESSION_LEVEL)
+    if len(compressed) >= len(file_content):
+        return file_content, None
+    return compressed, "gzip"
+
+
 def validate_upload_response(result: dict) -> bool:
     """Validate upload response has required fields"""
     required_fields = ["document_id", "filename", "page_count", "file_size", "message"]
@@ -60,16 +135,96 @@ def validate_export_response(result: dict) -> bool:
     return all(field in result for field in required_fields)
 
 
-@st.cache_data(ttl=30)  # Cache for 30 seconds
+@st.cache_data(ttl=30, show_spinner=False)  # Cache for 30 seconds, no spinner on refresh
 def check_backend_health() -> bool:
     """Check if backend is available (cached)"""
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=HEALTH_CHECK_TIMEOUT)
+        response = HEALTH_SESSION.get(
+            f"{BACKEND_URL}/health", timeout=HEALTH_CHECK_TIMEOUT
+        )
         return response.status_code == 200
     except Exception:
         return False
 
 
+def compute_content_digest(file_content: bytes) -> str:
+    """Compute SHA-256 hex digest of file content (matches backend upload lookup)"""
+    return hashlib.sha256(file_content).hexdigest()
+
+
+def compute_file_digest(file) -> str:
+    """Compute SHA-256 hex digest of an uploaded file without copying its bytes"""
+    file.seek(0)
+    # UploadedFile is a BytesIO, so file_digest hashes its getbuffer() view in one
+    # call rather than copying the contents out with getvalue()
+    digest = hashlib.file_digest(file, "sha256").hexdigest()
+    file.seek(0)
+    return digest
+
+
+def find_uploaded_document(content_digest: str) -> Optional[Dict[str, Any]]:
+    """Return the stored upload for a content digest, or None if a full upload is needed"""
+    try:
+        response = API_SESSION.get(
+            f"{BACKEND_URL}/upload/{content_digest}", timeout=HEALTH_CHECK_TIMEOUT
+        )
+        if response.status_code == 200:
+            return response.json()
+        return None
+
+    except requests.exceptions.RequestException as e:
+        # Lookup is only an optimization - fall back to a full upload
+        logger.warning(f"Upload lookup failed, falling back to full upload: {e}")
+        return None
+
+
+def upload_document_chunks(
+    payload: bytes, filename: str, progress_bar=None, chunk_size: int = DOCUMENT_CHUNK_SIZE
+) -> str:
+    """Send an upload body to the backend as concurrent parts, returning its upload ID
+
+    A failed part is retried on its own by API_SESSION instead of restarting the
+    whole file. progress_bar is only touched from this thread.
+    """
+    upload_id = uuid.uuid4().hex
+    total = len(payload)
+    offsets = range(0, total, chunk_size)
+
+    def send_part(offset: int) -> None:
+        # Slice inside the worker so only in-flight parts are held as copies
+        part = payload[offset : offset + chunk_size]
+        response = API_SESSION.post(
+            f"{BACKEND_URL}/upload/chunk",
+            data={
+                "upload_id": upload_id,
+                "filename": filename,
+                "offset": offset,
+                "total": total,
+            },
+            files={"chunk": (filename, part)},
+            timeout=calculate_upload_timeout(len(part) / (1024 * 1024)),
+        )
+        response.raise_for_status()
+
+    workers = max(1, min(DOCUMENT_UPLOAD_WORKERS, len(offsets)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(send_part, offset) for offset in offsets]
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                if progress_bar:
+                    progress_bar.progress(30 + 40 * done // len(futures))
+        except Exception:
+            # Don't send the rest of the file once a part has failed
+            pool.shutdown(cancel_futures=True)
+            raise
+
+    cprint(
+        f"[FRONTEND] Sent {filename} in {len(futures)} parts ({total} bytes)", "cyan"
+    )
+    return upload_id
+
+
 def upload_document(
     file_content: bytes, filename: str, progress_bar=None, status_text=None
 ) -> Optional[Dict[str, Any]]:
@@ -83,19 +238,47 @@ def upload_document(
             f"User uploaded file: {filename}, size: {len(file_content) / (1024 * 1024):.2f} MB"
         )
 
+        # Skip the transfer entirely if the backend already has this content
+        content_digest = compute_content_digest(file_content)
+        existing = find_uploaded_document(content_digest)
+        if existing:
+            if progress_bar:
+                progress_bar.progress(100)
+            if status_text:
+                status_text.text("✅ Upload complete!")
+            cprint(f"[FRONTEND] Reusing stored document: {filename}", "green")
+            return existing
+
         if status_text:
             status_text.text("Uploading document to server...")
         if progress_bar:
             progress_bar.progress(30)
 
-        files = {"file": (filename, file_content)}
-        file_size_mb = len(file_content) / (1024 * 1024)
+        payload, content_encoding = compress_upload(file_content)
+        data = {"content_encoding": content_encoding} if content_encoding else None
+        file_size_mb = len(payload) / (1024 * 1024)
         timeout = calculate_upload_timeout(file_size_mb)
 
+        if content_encoding:
+            cprint(
+                f"[FRONTEND] Compressed upload: {len(file_content)} -> {len(payload)} bytes",
+                "cyan",
+            )
         cprint(f"[FRONTEND] Uploading document: {filename}", "cyan")
-        response = API_SESSION.post(
-            f"{BACKEND_URL}/upload", files=files, timeout=timeout
-        )
+        if len(payload) > DOCUMENT_CHUNK_SIZE:
+            upload_id = upload_document_chunks(payload, filename, progress_bar)
+            response = FINALIZE_SESSION.post(
+                f"{BACKEND_URL}/upload/complete",
+                json={"upload_id": upload_id, "content_encoding": content_encoding},
+                timeout=timeout,
+            )
+        else:
+            response = API_SESSION.post(
+                f"{BACKEND_URL}/upload",
+                files={"file": (filename, payload)},
+                data=data,
+                timeout=timeout,
+            )
 
         if progress_bar:
             progress_bar.progress(70)
@@ -228,47 +411,90 @@ def download_document(document_id: str) -> Optional[bytes]:
         return None
 
 
-def upload_reference_documents(
-    reference_files, case_context: str, timeout: int = 300
-) -> Optional[Dict[str, Any]]:
-    """Upload reference documents to create corpus for AI verification"""
-    try:
-        # Prepare files for upload
-        files = [
-            ("files", (file.name, file.getvalue(), file.type))
-            for file in reference_files
-        ]
+def upload_reference_file_chunks(file, chunk_size: int = REFERENCE_CHUNK_SIZE) -> str:
+    """Send one reference file to the backend in fixed-size chunks, returning its upload ID
+
+    Each chunk POST goes through API_SESSION, whose retry strategy re-sends a failed
+    chunk with exponential backoff instead of restarting the whole file.
+    """
+    upload_id = uuid.uuid4().hex
+    total = file.size
+    file.seek(0)
 
-        # Call API
+    # Only one chunk is alive at a time, so peak memory is chunk_size per file
+    # range() needs at least one step so empty files still register an upload
+    for offset in range(0, max(total, 1), chunk_size):
+        chunk = file.read(chunk_size)
         response = API_SESSION.post(
-            f"{BACKEND_URL}/api/verify/upload-references",
-            data={"case_context": case_context},
-            files=files,
+            f"{BACKEND_URL}/api/verify/upload-references/chunk",
+            data={
+                "upload_id": upload_id,
+                "filename": file.name,
+                "offset": offset,
+                "total": total,
+            },
+            files={"chunk": (file.name, chunk, file.type)},
+            timeout=calculate_upload_timeout(len(chunk) / (1024 * 1024)),
+        )
+        response.raise_for_status()
+
+    cprint(f"[FRONTEND] Sent {file.name} in chunks ({total} bytes)", "cyan")
+    return upload_id
+
+
+def chunked_upload_reference_documents(
+    reference_files,
+    case_context: str,
+    chunk_size: int = REFERENCE_CHUNK_SIZE,
+    timeout: int = 300,
+    on_file_done: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """Upload reference documents in chunks, then create the corpus from them
+
+    Files are sent concurrently since each upload is network-bound; the finalize
+    call then receives the upload IDs in the original file order. on_file_done is
+    called once per file as it finishes, from this thread only. Runs on a worker
+    thread, so failures raise BackendError for the caller to display.
+    """
+    try:
+        workers = max(1, min(REFERENCE_UPLOAD_WORKERS, len(reference_files)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(upload_reference_file_chunks, file, chunk_size)
+                for file in reference_files
+            ]
+            for future in as_completed(futures):
+                future.result()
+                if on_file_done:
+                    on_file_done()
+            upload_ids = [future.result() for future in futures]
+
+        response = FINALIZE_SESSION.post(
+            f"{BACKEND_URL}/api/verify/upload-references/finalize",
+            json={"upload_ids": upload_ids, "case_context": case_context},
             timeout=timeout,
         )
 
         response.raise_for_status()
         return response.json()
 
-    except requests.exceptions.Timeout:
-        st.error("⚠️ Reference upload timed out. Please try again.")
+    except requests.exceptions.Timeout as e:
         logger.error("Reference upload timeout")
-        return None
+        raise BackendError("⚠️ Reference upload timed out. Please try again.") from e
 
-    except requests.exceptions.ConnectionError:
-        st.error("⚠️ Cannot connect to backend server. Please contact support.")
+    except requests.exceptions.ConnectionError as e:
         logger.error("Connection error during reference upload")
-        return None
+        raise BackendError(
+            "⚠️ Cannot connect to backend server. Please contact support."
+        ) from e
 
     except requests.exceptions.HTTPError as e:
-        st.error(f"❌ Failed to upload references: {e.response.text}")
         logger.error(f"HTTP error during reference upload: {e}")
-        return None
+        raise BackendError(f"❌ Failed to upload references: {e.response.text}") from e
 
     except Exception as e:
-        st.error(f"❌ Error: {str(e)}")
         logger.error(f"Unexpected error during reference upload: {e}")
-        return None
+        raise BackendError(f"❌ Error: {str(e)}") from e
 
 
 def execute_verification(
@@ -277,8 +503,11 @@ def execute_verification(
     case_context: str,
     splitting_mode: str,
     timeout: int = 600,
-) -> Optional[Dict[str, Any]]:
-    """Execute AI verification against uploaded corpus"""
+) -> Dict[str, Any]:
+    """Execute AI verification against uploaded corpus
+
+    Runs on a worker thread, so failures raise BackendError for the caller to display.
+    """
     try:
         # Call verification API
         response = API_SESSION.post(
@@ -295,25 +524,23 @@ def execute_verification(
         response.raise_for_status()
         return response.json()
 
-    except requests.exceptions.Timeout:
-        st.error("⚠️ Verification timed out. Please try again.")
+    except requests.exceptions.Timeout as e:
         logger.error("Verification timeout")
-        return None
+        raise BackendError("⚠️ Verification timed out. Please try again.") from e
 
-    except requests.exceptions.ConnectionError:
-        st.error("⚠️ Cannot connect to backend server. Please contact support.")
+    except requests.exceptions.ConnectionError as e:
         logger.error("Connection error during verification")
-        return None
+        raise BackendError(
+            "⚠️ Cannot connect to backend server. Please contact support."
+        ) from e
 
     except requests.exceptions.HTTPError as e:
-        st.error(f"❌ Verification failed: {e.response.text}")
         logger.error(f"HTTP error during verification: {e}")
-        return None
+        raise BackendError(f"❌ Verification failed: {e.response.text}") from e
 
     except Exception as e:
-        st.error(f"❌ Error during verification: {str(e)}")
         logger.error(f"Unexpected error during verification: {e}")
-        return None
+        raise BackendError(f"❌ Error during verification: {str(e)}") from e
 
 
 def reset_verification(document_id: str, timeout: int = 10) -> bool:
@@ -12,6 +12,24 @@ BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 # File Upload Limits
 MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "100"))
 
+# Upload Compression
+# Files below the minimum size aren't worth the CPU; samples above the entropy
+# threshold (bits/byte) are already compressed (e.g. FlateDecode PDF streams)
+UPLOAD_COMPRESSION_MIN_BYTES = int(os.getenv("UPLOAD_COMPRESSION_MIN_BYTES", str(1024 * 1024)))
+UPLOAD_COMPRESSION_LEVEL = int(os.getenv("UPLOAD_COMPRESSION_LEVEL", "1"))
+UPLOAD_COMPRESSION_MAX_ENTROPY = 7.5
+UPLOAD_COMPRESSION_SAMPLE_BYTES = 64 * 1024
+
+# Reference documents are sent to the backend in chunks of this size
+REFERENCE_CHUNK_SIZE = int(os.getenv("REFERENCE_CHUNK_SIZE", str(5 * 1024 * 1024)))
+
+# Reference files uploaded concurrently (stays under the session's 10-connection pool)
+REFERENCE_UPLOAD_WORKERS = int(os.getenv("REFERENCE_UPLOAD_WORKERS", "4"))
+
+# Documents larger than one part are sent in parts of this size, several at a time
+DOCUMENT_CHUNK_SIZE = int(os.getenv("DOCUMENT_CHUNK_SIZE", str(8 * 1024 * 1024)))
+DOCUMENT_UPLOAD_WORKERS = int(os.getenv("DOCUMENT_UPLOAD_WORKERS", "4"))
+
 # Timeout Configuration
 UPLOAD_TIMEOUT_BASE = int(os.getenv("UPLOAD_TIMEOUT_BASE", "180"))
 EXPORT_TIMEOUT = int(os.getenv("EXPORT_TIMEOUT", "300"))
@@ -30,6 +48,11 @@ OUTPUT_FORMAT_LABELS = {
     "json": "📊 JSON File - Full verification metadata with citations",
 }
 
+# Selectbox labels (text before " - "), derived once rather than per option per run
+OUTPUT_FORMAT_SHORT_LABELS = {
+    key: label.split(" - ")[0] for key, label in OUTPUT_FORMAT_LABELS.items()
+}
+
 MIME_TYPES = {
     "word_landscape": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     "word_portrait": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -46,9 +69,12 @@ FORMAT_DESCRIPTIONS = {
     "json": "JSON format provides complete verification data with metadata and citations.",
 }
 
+# Debug mode (read once here; main.py is re-executed on every rerun)
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
 # Feature Flags
 FEATURES = {
-    "show_debug_info": os.getenv("DEBUG", "false").lower() == "true",
+    "show_debug_info": DEBUG,
     "show_advanced_options": os.getenv("SHOW_ADVANCED", "false").lower() == "true",
 }
 
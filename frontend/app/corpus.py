@@ -4,9 +4,209 @@ Firm-inspired compact sidebar design
 """
 
 import streamlit as st
-from .api_client import upload_reference_documents, delete_corpus
+from concurrent.futures import ThreadPoolExecutor
+from termcolor import cprint
+from .api_client import (
+    BackendError,
+    chunked_upload_reference_documents,
+    compute_file_digest,
+    delete_corpus,
+)
 from .state import reset_corpus_state
 
+# Reference uploads run off the script thread so the page stays interactive
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Seconds between status checks while a reference upload is running
+UPLOAD_POLL_INTERVAL = 0.5
+
+
+def start_corpus_upload(reference_files, case_context: str) -> None:
+    """Submit the reference upload to the background pool, skipping repeated files"""
+    # The form only shows without an active corpus, so only the selection itself
+    # can contain duplicates
+    seen_hashes = set()
+    new_files = []
+    for file in reference_files:
+        content_hash = compute_file_digest(file)
+        if content_hash in seen_hashes:
+            cprint(f"[FRONTEND] Skipping duplicate reference: {file.name}", "yellow")
+            continue
+        seen_hashes.add(content_hash)
+        new_files.append(file)
+
+    st.session_state.corpus_creation_in_progress = True
+    st.session_state.corpus_upload_context = case_context
+
+    # Plain dict shared with the worker; it can't write session state directly
+    progress = {"done": 0, "total": len(new_files)}
+    st.session_state.upload_progress = progress
+
+    def mark_file_done() -> None:
+        progress["done"] += 1
+
+    future = _UPLOAD_POOL.submit(
+        chunked_upload_reference_documents,
+        new_files,
+        case_context,
+        on_file_done=mark_file_done,
+    )
+    # Release the uploaded buffers once sent; a retry gets fresh objects from the widget
+    future.add_done_callback(lambda _: close_uploaded_files(new_files))
+    st.session_state.upload_future = future
+    cprint(f"[FRONTEND] Started background upload: {len(new_files)} files", "cyan")
+
+
+def close_uploaded_files(files) -> None:
+    """Close UploadedFile buffers after their contents have been sent"""
+    for file in files:
+        try:
+            file.close()
+        except Exception:
+            pass
+
+
+def submit_corpus_form(context_key: str, files_key: str) -> None:
+    """Form submit callback: start the upload from the submitted widget values
+
+    Reads the widgets by key because callback args are captured when the form
+    renders, before the submitted values are committed.
+    """
+    reference_files = st.session_state.get(files_key)
+    if not reference_files:
+        st.session_state.corpus_form_missing_files = True
+        return
+    start_corpus_upload(reference_files, st.session_state.get(context_key) or "")
+
+
+@st.fragment(run_every=UPLOAD_POLL_INTERVAL)
+def render_upload_status() -> None:
+    """Poll the background reference upload; only this fragment reruns while it runs"""
+    future = st.session_state.get("upload_future")
+    if future is None:
+        return
+
+    if not future.done():
+        progress = st.session_state.upload_progress
+        if progress["done"] < progress["total"]:
+            text = f"Uploading {progress['done']}/{progress['total']} reference documents..."
+        else:
+            text = "Creating reference library..."
+        st.progress(progress["done"] / progress["total"], text=text)
+        return
+
+    st.session_state.upload_future = None
+    st.session_state.corpus_creation_in_progress = False
+    try:
+        result = future.result()
+    except BackendError as e:
+        # The worker thread can't render, so keep its message for the page
+        st.session_state.corpus_upload_error = str(e)
+    else:
+        # Store corpus information in session state
+        st.session_state.store_id = result["store_id"]
+        st.session_state.reference_docs_uploaded = True
+        st.session_state.case_context = st.session_state.corpus_upload_context
+        st.session_state.corpus_metadata = normalize_corpus_metadata(
+            result.get("metadata", [])
+        )
+        store_corpus_totals(st.session_state.corpus_metadata)
+        st.session_state.corpus_just_created = True
+
+    # A fragment rerun only redraws this block; the sidebar needs a full rerun
+    # to switch to the active corpus view
+    st.rerun(scope="app")
+
+
+def render_upload_feedback() -> None:
+    """Show upload progress or a one-time failure message"""
+    if st.session_state.get("corpus_form_missing_files", False):
+        st.warning("⚠️ Please provide: Reference Documents")
+        st.session_state.corpus_form_missing_files = False
+    if st.session_state.get("upload_future") is not None:
+        render_upload_status()
+    if st.session_state.get("corpus_upload_error"):
+        st.error(st.session_state.corpus_upload_error)
+        st.session_state.corpus_upload_error = None
+
+
+# Fields read from each reference document's metadata, with display defaults
+METADATA_DEFAULTS = {
+    "filename": "Unknown",
+    "document_type": "N/A",
+    "summary": "N/A",
+    "file_size_bytes": 0,
+    "page_count": 0,
+    "keywords": [],
+}
+
+
+def normalize_corpus_metadata(raw_metadata) -> list:
+    """Convert upload metadata (dicts or objects) to uniform dicts once at ingestion"""
+    return [
+        {
+            field: (
+                meta.get(field, default)
+                if isinstance(meta, dict)
+                else getattr(meta, field, default)
+            )
+            for field, default in METADATA_DEFAULTS.items()
+        }
+        for meta in raw_metadata
+    ]
+
+
+def store_corpus_totals(metadata: list) -> None:
+    """Compute corpus totals once when the upload completes"""
+    st.session_state.corpus_total_bytes = sum(m["file_size_bytes"] for m in metadata)
+    st.session_state.corpus_total_pages = sum(m["page_count"] for m in metadata)
+
+
+def get_corpus_stats() -> dict:
+    """Return document count, storage and page totals for the active corpus"""
+    return {
+        "doc_count": len(st.session_state.corpus_metadata or []),
+        "total_bytes": st.session_state.corpus_total_bytes,
+        "total_pages": st.session_state.corpus_total_pages,
+    }
+
+
+def memoized_corpus_markdown(name: str, build) -> str:
+    """Return markdown built by build(), rebuilt only when the corpus changes
+
+    Entries are keyed on (store_id, document count) in session state, so reruns
+    triggered elsewhere on the page reuse the string instead of re-walking metadata.
+    """
+    if "_corpus_render_cache" not in st.session_state:
+        st.session_state._corpus_render_cache = {}
+
+    corpus_key = (
+        st.session_state.store_id,
+        len(st.session_state.corpus_metadata or []),
+    )
+    cached = st.session_state._corpus_render_cache.get(name)
+    if cached is None or cached[0] != corpus_key:
+        cached = (corpus_key, build())
+        st.session_state._corpus_render_cache[name] = cached
+    return cached[1]
+
+
+def render_created_message(message: str) -> None:
+    """Show a one-time success message (formatted with doc_count) after corpus creation"""
+    if st.session_state.get("corpus_just_created", False):
+        st.success(message.format(doc_count=get_corpus_stats()["doc_count"]))
+        st.session_state.corpus_just_created = False
+
+
+def clear_corpus() -> None:
+    """Delete the corpus from the backend (if one exists) and reset local state"""
+    # A repeated click finds store_id already reset, so no second DELETE is sent
+    if st.session_state.store_id:
+        with st.spinner("Deleting corpus..."):
+            if not delete_corpus(st.session_state.store_id):
+                st.error("❌ Failed to delete corpus. Clearing local state only.")
+    reset_corpus_state()
+
 
 def render_corpus_creation() -> None:
     """Render corpus creation form (when no active corpus)"""
@@ -15,71 +215,44 @@ def render_corpus_creation() -> None:
     # Show clearer instructions
     st.info("📝 **Instructions:** Upload reference documents to enable the button")
 
-    case_context = st.text_area(
-        "Case Context (Optional)",
-        placeholder="Describe what you're verifying (e.g., 'Contract verification for Project X')",
-        max_chars=500,
-        help="Provide context to help AI understand the verification case (optional but recommended)",
-        key="case_context_input",
-    )
-
-    reference_files = st.file_uploader(
-        "Select Reference Documents *",
-        type=["pdf", "docx"],
-        accept_multiple_files=True,
-        help="Upload documents as grounding for verification (PDF or DOCX)",
-        key="reference_uploader",
-    )
-
-    # Show status of required fields
-    if not reference_files:
-        st.warning("⚠️ Please provide: Reference Documents")
-
     # Check if we're already processing to prevent double-click
     is_processing = st.session_state.get("corpus_creation_in_progress", False)
 
-    # Use button with key to track clicks (no callback needed)
-    create_clicked = st.button(
-        "Create Reference Library",
-        disabled=not reference_files or is_processing,
-        type="primary",
-        use_container_width=True,
-        key="create_corpus_main",
-    )
-
-    # Process corpus creation when button is clicked (only once per click)
-    if create_clicked and not is_processing:
-        # Set processing flag immediately to prevent double-execution
-        st.session_state.corpus_creation_in_progress = True
+    # Form batches the inputs so typing the context doesn't rerun the page per edit
+    with st.form("corpus_create_form", clear_on_submit=False, border=False):
+        st.text_area(
+            "Case Context (Optional)",
+            placeholder="Describe what you're verifying (e.g., 'Contract verification for Project X')",
+            max_chars=500,
+            help="Provide context to help AI understand the verification case (optional but recommended)",
+            key="case_context_input",
+        )
 
-        with st.spinner("Creating reference library..."):
-            result = upload_reference_documents(reference_files, case_context)
+        st.file_uploader(
+            "Select Reference Documents *",
+            type=["pdf", "docx"],
+            accept_multiple_files=True,
+            help="Upload documents as grounding for verification (PDF or DOCX)",
+            key="reference_uploader",
+        )
 
-            if result:
-                # Store corpus information in session state
-                st.session_state.store_id = result["store_id"]
-                st.session_state.reference_docs_uploaded = True
-                st.session_state.case_context = case_context
-                st.session_state.corpus_metadata = result.get("metadata", [])
-                st.session_state.corpus_just_created = True
+        # Callback runs before the rerun, so the button renders disabled without a second run
+        st.form_submit_button(
+            "Create Reference Library",
+            disabled=is_processing,
+            type="primary",
+            use_container_width=True,
+            on_click=submit_corpus_form,
+            args=("case_context_input", "reference_uploader"),
+        )
 
-        # Clear processing flag
-        st.session_state.corpus_creation_in_progress = False
-        # Force UI update to show corpus stats immediately
-        st.rerun()
+    render_upload_feedback()
 
 
 def render_active_corpus() -> None:
     """Render active corpus information and management"""
     # Show one-time success message if corpus was just created
-    if st.session_state.get("corpus_just_created", False):
-        doc_count = (
-            len(st.session_state.corpus_metadata)
-            if st.session_state.corpus_metadata
-            else 0
-        )
-        st.success(f"✅ Uploaded {doc_count} reference document(s) successfully!")
-        st.session_state.corpus_just_created = False
+    render_created_message("✅ Uploaded {doc_count} reference document(s) successfully!")
 
     st.success("✅ Corpus is active and ready for verification")
 
@@ -94,20 +267,73 @@ def render_active_corpus() -> None:
     # Display metadata if available
     if st.session_state.corpus_metadata:
         with st.expander("📄 View Document Metadata", expanded=False, key="corpus_metadata_expander"):
-            for meta in st.session_state.corpus_metadata:
-                st.markdown(f"**{meta['filename']}**")
-                st.caption(f"Type: {meta.get('document_type', 'N/A')}")
-                st.caption(f"Summary: {meta.get('summary', 'N/A')}")
-                st.divider()
+            st.markdown(
+                memoized_corpus_markdown(
+                    "metadata_expander",
+                    lambda: "\n\n---\n\n".join(
+                        f"**{meta['filename']}**  \n"
+                        f"Type: {meta['document_type']}  \n"
+                        f"Summary: {meta['summary']}"
+                        for meta in st.session_state.corpus_metadata
+                    ),
+                )
+            )
 
     st.divider()
 
-    # Clear corpus button
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col3:
-        if st.button("🗑️ Clear Corpus", type="secondary", use_container_width=True):
-            reset_corpus_state()
-            # Streamlit will automatically rerun when session state changes
+    # Clear corpus button, right-aligned in the narrow column
+    _, clear_col = st.columns([2, 1])
+    with clear_col:
+        # Callback clears state before the click's rerun renders the creation form
+        st.button(
+            "🗑️ Clear Corpus",
+            type="secondary",
+            use_container_width=True,
+            on_click=clear_corpus,
+        )
+
+
+def build_library_markdown() -> str:
+    """Build the Library Contents listing as a single markdown string"""
+    entries = []
+    for idx, meta in enumerate(st.session_state.corpus_metadata):
+        # Metadata is normalized to dicts when the upload completes
+        lines = [
+            f"**{idx + 1}. {meta['filename']}**",
+            f"📑 Type: {meta['document_type']}",
+            f"📄 Pages: {meta['page_count']} | 💾 Size: {meta['file_size_bytes'] / 1024:.1f} KB",
+            f"📝 {meta['summary']}",
+        ]
+        if meta["keywords"]:
+            lines.append(f"🏷️ Keywords: {', '.join(meta['keywords'][:5])}")
+        entries.append("  \n".join(lines))
+    return "\n\n---\n\n".join(entries)
+
+
+@st.fragment
+def render_library_fragment() -> None:
+    """Render the View Library toggle and its contents
+
+    Uses @st.fragment so toggling the library only reruns this block instead of
+    the whole page.
+    """
+    if st.button("📄 View Library", key="view_docs_sidebar", use_container_width=True):
+        # Toggle before rendering so the expander reflects the click in this run
+        st.session_state.view_library_expanded = not st.session_state.get(
+            "view_library_expanded", False
+        )
+
+    if not st.session_state.get("view_library_expanded", False):
+        return
+
+    with st.expander("Library Contents", expanded=True):
+        if st.session_state.corpus_metadata:
+            # One markdown element for the whole library instead of ~6 per document
+            st.markdown(
+                memoized_corpus_markdown("library_contents", build_library_markdown)
+            )
+        else:
+            st.info("No metadata available")
 
 
 def render_corpus_sidebar() -> None:
@@ -115,254 +341,96 @@ def render_corpus_sidebar() -> None:
     Render the corpus sidebar with Firm styling
     Compact design for always-visible sidebar
     """
-    st.markdown('<div class="fm-sidebar-content">', unsafe_allow_html=True)
+    # Keyed container gives the column a stable .st-key-fm_sidebar_content class for CSS
+    with st.container(key="fm_sidebar_content"):
+        st.markdown("## Reference Corpus")
+        st.info(
+            "📚 **Knowledge Base** - Upload reference documents as grounding for verification"
+        )
 
-    st.markdown("## Reference Corpus")
-    st.info(
-        "📚 **Knowledge Base** - Upload reference documents as grounding for verification"
-    )
+        # Status
+        if st.session_state.reference_docs_uploaded:
+            st.success("✓ Active & Verification-Ready")
+        else:
+            st.warning("⏳ No Corpus Loaded")
 
-    # Status
-    if st.session_state.reference_docs_uploaded:
-        st.success("✓ Active & Verification-Ready")
-    else:
-        st.warning("⏳ No Corpus Loaded")
+        # Stats (if corpus is active)
+        if st.session_state.reference_docs_uploaded:
+            stats = get_corpus_stats()
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Documents", stats["doc_count"])
 
-    # Stats (if corpus is active)
-    if st.session_state.reference_docs_uploaded:
-        col1, col2 = st.columns(2)
-        with col1:
-            doc_count = (
-                len(st.session_state.corpus_metadata)
-                if st.session_state.corpus_metadata
-                else 0
-            )
-            st.metric("Documents", doc_count)
-
-            # Calculate total storage from metadata
-            total_bytes = 0
-            if st.session_state.corpus_metadata:
-                for doc_meta in st.session_state.corpus_metadata:
-                    # Access file_size_bytes attribute
-                    if hasattr(doc_meta, "file_size_bytes"):
-                        total_bytes += doc_meta.file_size_bytes
-                    elif isinstance(doc_meta, dict) and "file_size_bytes" in doc_meta:
-                        total_bytes += doc_meta["file_size_bytes"]
-
-            total_mb = total_bytes / (1024 * 1024)
-            st.metric("Storage", f"{total_mb:.1f} MB")
-
-        with col2:
-            # Calculate total pages from metadata
-            total_pages = 0
-            if st.session_state.corpus_metadata:
-                for doc_meta in st.session_state.corpus_metadata:
-                    # Access page_count attribute
-                    if hasattr(doc_meta, "page_count"):
-                        total_pages += doc_meta.page_count
-                    elif isinstance(doc_meta, dict) and "page_count" in doc_meta:
-                        total_pages += doc_meta["page_count"]
-
-            st.metric("Pages", total_pages)
-            st.metric("Chunks", "N/A")  # Not available from File Search
-
-    # Quick Upload / Corpus Creation
-    if not st.session_state.reference_docs_uploaded:
-        # Custom CSS to hide scrollbar but keep resize handle
-        # Target by unique key to ensure proper scoping
-        st.markdown("""
-            <style>
-            /* Hide scrollbar for the case context text area while keeping resize capability */
-            .st-key-case_context_sidebar textarea {
-                overflow: hidden !important;
-                resize: vertical !important;
-                scrollbar-width: none !important; /* Firefox */
-                -ms-overflow-style: none !important; /* IE and Edge */
-            }
-            .st-key-case_context_sidebar textarea::-webkit-scrollbar {
-                display: none !important; /* Chrome, Safari, Opera */
-            }
-            /* Remove extra margin below text area */
-            .st-key-case_context_sidebar div[data-testid="stTextArea"] {
-                margin-bottom: 0 !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-
-        case_context = st.text_area(
-            "Case Context",
-            placeholder="Brief description of case or project...",
-            height=120,
-            key="case_context_sidebar",
-            label_visibility="collapsed",
-            max_chars=500,
-        )
+                total_mb = stats["total_bytes"] / (1024 * 1024)
+                st.metric("Storage", f"{total_mb:.1f} MB")
 
-        uploaded_refs = st.file_uploader(
-            "Upload reference documents",
-            type=["pdf", "docx"],
-            accept_multiple_files=True,
-            key="corpus_upload_sidebar",
-            label_visibility="collapsed",
-            help="These documents form the knowledge base that Gemini uses to verify your document",
-        )
+            with col2:
+                st.metric("Pages", stats["total_pages"])
+                st.metric("Chunks", "N/A")  # Not available from File Search
 
-        if uploaded_refs:
+        # Quick Upload / Corpus Creation
+        if not st.session_state.reference_docs_uploaded:
             # Check if we're already processing to prevent double-click
             is_processing = st.session_state.get("corpus_creation_in_progress", False)
 
-            # Use button with key to track clicks (no callback needed)
-            create_sidebar_clicked = st.button(
-                "Create Corpus",
-                type="primary",
-                use_container_width=True,
-                key="create_corpus_sidebar",
-                disabled=is_processing,
-            )
+            # Form batches the inputs so typing the context doesn't rerun the page per edit
+            with st.form("corpus_create_sidebar_form", clear_on_submit=False, border=False):
+                st.text_area(
+                    "Case Context",
+                    placeholder="Brief description of case or project...",
+                    height=120,
+                    key="case_context_sidebar",
+                    label_visibility="collapsed",
+                    max_chars=500,
+                )
 
-            # Process corpus creation when button is clicked (only once per click)
-            if create_sidebar_clicked and not is_processing:
-                # Set processing flag immediately to prevent double-execution
-                st.session_state.corpus_creation_in_progress = True
+                st.file_uploader(
+                    "Upload reference documents",
+                    type=["pdf", "docx"],
+                    accept_multiple_files=True,
+                    key="corpus_upload_sidebar",
+                    label_visibility="collapsed",
+                    help="These documents form the knowledge base that Gemini uses to verify your document",
+                )
 
-                with st.spinner("Creating reference library..."):
-                    result = upload_reference_documents(uploaded_refs, case_context)
+                # Callback runs before the rerun, so the button renders disabled without a second run
+                st.form_submit_button(
+                    "Create Corpus",
+                    type="primary",
+                    use_container_width=True,
+                    disabled=is_processing,
+                    on_click=submit_corpus_form,
+                    args=("case_context_sidebar", "corpus_upload_sidebar"),
+                )
 
-                    if result:
-                        # Store corpus information in session state
-                        st.session_state.store_id = result["store_id"]
-                        st.session_state.reference_docs_uploaded = True
-                        st.session_state.case_context = case_context
-                        st.session_state.corpus_metadata = result.get("metadata", [])
-                        st.session_state.corpus_just_created = True
+            render_upload_feedback()
 
-                # Clear processing flag
-                st.session_state.corpus_creation_in_progress = False
-                # Force UI update to show corpus stats immediately
-                st.rerun()
+        # Actions (if corpus is active)
+        if st.session_state.reference_docs_uploaded:
+            # Show one-time success message if corpus was just created
+            render_created_message("✅ Created! {doc_count} document(s) uploaded")
 
-    # Actions (if corpus is active)
-    if st.session_state.reference_docs_uploaded:
-        # Show one-time success message if corpus was just created
-        if st.session_state.get("corpus_just_created", False):
-            doc_count = (
-                len(st.session_state.corpus_metadata)
-                if st.session_state.corpus_metadata
-                else 0
-            )
-            st.success(f"✅ Created! {doc_count} document(s) uploaded")
-            st.session_state.corpus_just_created = False
-
-        st.markdown("**Actions**")
-
-        # Custom CSS to reduce button spacing
-        st.markdown("""
-            <style>
-            div[data-testid="stVerticalBlock"] > div:has(button) {
-                margin-bottom: 0.25rem !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-
-        if st.button(
-            "📄 View Library", key="view_docs_sidebar", use_container_width=True
-        ):
-            # Toggle the view library expanded state
-            if "view_library_expanded" not in st.session_state:
-                st.session_state.view_library_expanded = True
-            else:
-                st.session_state.view_library_expanded = (
-                    not st.session_state.view_library_expanded
-                )
-            st.rerun()
+            st.markdown("**Actions**")
 
-        if st.button(
-            "⚙️ Configure",
-            key="config_sidebar",
-            use_container_width=True,
-            disabled=True,
-            help="Configuration coming soon",
-        ):
-            # Show configuration options (disabled for now)
-            pass
+            render_library_fragment()
 
-        if st.button(
-            "🗑️ Clear Corpus",
-            key="clear_sidebar",
-            type="secondary",
-            use_container_width=True,
-        ):
-            # Delete corpus from backend first
-            if st.session_state.store_id:
-                with st.spinner("Deleting corpus..."):
-                    success = delete_corpus(st.session_state.store_id)
-                    if success:
-                        reset_corpus_state()
-                        st.rerun()
-                    else:
-                        st.error(
-                            "❌ Failed to delete corpus. Clearing local state only."
-                        )
-                        reset_corpus_state()
-                        st.rerun()
-            else:
-                # No store_id, just reset state
-                reset_corpus_state()
-                st.rerun()
-
-    # View Library Expander (show when toggled)
-    if st.session_state.reference_docs_uploaded and st.session_state.get(
-        "view_library_expanded", False
-    ):
-        with st.expander("Library Contents", expanded=True):
-            if st.session_state.corpus_metadata:
-                for idx, meta in enumerate(st.session_state.corpus_metadata):
-                    # Handle both dict and object formats
-                    filename = (
-                        meta.get("filename")
-                        if isinstance(meta, dict)
-                        else getattr(meta, "filename", "Unknown")
-                    )
-                    doc_type = (
-                        meta.get("document_type", "N/A")
-                        if isinstance(meta, dict)
-                        else getattr(meta, "document_type", "N/A")
-                    )
-                    summary = (
-                        meta.get("summary", "N/A")
-                        if isinstance(meta, dict)
-                        else getattr(meta, "summary", "N/A")
-                    )
-                    file_size = (
-                        meta.get("file_size_bytes", 0)
-                        if isinstance(meta, dict)
-                        else getattr(meta, "file_size_bytes", 0)
-                    )
-                    page_count = (
-                        meta.get("page_count", 0)
-                        if isinstance(meta, dict)
-                        else getattr(meta, "page_count", 0)
-                    )
-                    keywords = (
-                        meta.get("keywords", [])
-                        if isinstance(meta, dict)
-                        else getattr(meta, "keywords", [])
-                    )
-
-                    st.markdown(f"**{idx + 1}. {filename}**")
-                    st.caption(f"📑 Type: {doc_type}")
-                    st.caption(
-                        f"📄 Pages: {page_count} | 💾 Size: {file_size / 1024:.1f} KB"
-                    )
-                    st.caption(f"📝 {summary}")
-                    if keywords:
-                        st.caption(f"🏷️ Keywords: {', '.join(keywords[:5])}")
-                    if idx < len(st.session_state.corpus_metadata) - 1:
-                        st.divider()
-            else:
-                st.info("No metadata available")
-
-    st.markdown("</div>", unsafe_allow_html=True)
+            if st.button(
+                "⚙️ Configure",
+                key="config_sidebar",
+                use_container_width=True,
+                disabled=True,
+                help="Configuration coming soon",
+            ):
+                # Show configuration options (disabled for now)
+                pass
+
+            st.button(
+                "🗑️ Clear Corpus",
+                key="clear_sidebar",
+                type="secondary",
+                use_container_width=True,
+                on_click=clear_corpus,
+            )
 
 
 def render_corpus_management() -> None:
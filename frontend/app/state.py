@@ -3,71 +3,99 @@ Session State Management for Content Verification Tool
 """
 
 import streamlit as st
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
 
 
-def init_session_state() -> None:
-    """Initialize all session state variables"""
+@dataclass(frozen=True, slots=True)
+class SessionDefaults:
+    """Typed default value for every session state key, grouped by workflow area"""
 
     # Document upload state
-    if "document_id" not in st.session_state:
-        st.session_state.document_id = None
-    if "document_info" not in st.session_state:
-        st.session_state.document_info = None
-    if "upload_in_progress" not in st.session_state:
-        st.session_state.upload_in_progress = False
-    if "last_generated" not in st.session_state:
-        st.session_state.last_generated = None
-
+    document_id: Optional[str] = None
+    document_info: Optional[Dict[str, Any]] = None
+    upload_in_progress: bool = False
+    last_generated: Optional[Dict[str, Any]] = None
     # AI Verification state
-    if "store_id" not in st.session_state:
-        st.session_state.store_id = None
-    if "reference_docs_uploaded" not in st.session_state:
-        st.session_state.reference_docs_uploaded = False
-    if "case_context" not in st.session_state:
-        st.session_state.case_context = None
-    if "corpus_metadata" not in st.session_state:
-        st.session_state.corpus_metadata = None
-    if "corpus_creation_in_progress" not in st.session_state:
-        st.session_state.corpus_creation_in_progress = False
-    if "verification_complete" not in st.session_state:
-        st.session_state.verification_complete = False
-    if "verification_results" not in st.session_state:
-        st.session_state.verification_results = None
-    if "verification_in_progress" not in st.session_state:
-        st.session_state.verification_in_progress = False
-
+    store_id: Optional[str] = None
+    reference_docs_uploaded: bool = False
+    case_context: Optional[str] = None
+    corpus_metadata: Optional[List[Dict[str, Any]]] = None
+    corpus_total_bytes: int = 0
+    corpus_total_pages: int = 0
+    corpus_creation_in_progress: bool = False
+    verification_complete: bool = False
+    verification_results: Optional[Dict[str, Any]] = None
+    verification_summary: Optional[Dict[str, Any]] = None
+    verification_in_progress: bool = False
+    verify_future: Optional[Any] = None  # Background verification call, see main.py
+    verify_started_at: float = 0.0
     # Processing state
-    if "splitting_mode" not in st.session_state:
-        st.session_state.splitting_mode = "paragraph"
+    splitting_mode: str = "paragraph"
+
+
+SESSION_DEFAULTS = asdict(SessionDefaults())
+
+
+def pick_defaults(*keys) -> dict:
+    """Build a reset mapping for the given keys from SESSION_DEFAULTS"""
+    return {key: SESSION_DEFAULTS[key] for key in keys}
+
+
+# Prebuilt reset mappings, applied with a single session_state.update() call
+DOCUMENT_STATE_RESET = pick_defaults(
+    "document_id",
+    "document_info",
+    "upload_in_progress",
+    "last_generated",
+)
+CORPUS_STATE_RESET = pick_defaults(
+    "store_id",
+    "reference_docs_uploaded",
+    "case_context",
+    "corpus_metadata",
+    "corpus_total_bytes",
+    "corpus_total_pages",
+    "corpus_creation_in_progress",
+)
+VERIFICATION_STATE_RESET = pick_defaults(
+    "verification_complete",
+    "verification_results",
+    "verification_summary",
+    "verification_in_progress",
+    "verify_future",
+    "verify_started_at",
+    "splitting_mode",
+)
+ALL_STATE_RESET = {**DOCUMENT_STATE_RESET, **CORPUS_STATE_RESET, **VERIFICATION_STATE_RESET}
+
+
+def init_session_state() -> None:
+    """Initialize all session state variables"""
+    # Defaults only need seeding once per session; resets reassign, never delete
+    if st.session_state.get("_state_initialized", False):
+        return
+
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    st.session_state._state_initialized = True
 
 
 def reset_document_state() -> None:
     """Reset document-related session state"""
-    st.session_state.document_id = None
-    st.session_state.document_info = None
-    st.session_state.last_generated = None
-    st.session_state.upload_in_progress = False
+    st.session_state.update(DOCUMENT_STATE_RESET)
 
 
 def reset_corpus_state() -> None:
     """Reset corpus-related session state"""
-    st.session_state.store_id = None
-    st.session_state.reference_docs_uploaded = False
-    st.session_state.case_context = None
-    st.session_state.corpus_metadata = None
-    st.session_state.corpus_creation_in_progress = False
+    st.session_state.update(CORPUS_STATE_RESET)
 
 
 def reset_verification_state() -> None:
     """Reset verification-related session state"""
-    st.session_state.verification_complete = False
-    st.session_state.verification_results = None
-    st.session_state.verification_in_progress = False
-    st.session_state.splitting_mode = "paragraph"
+    st.session_state.update(VERIFICATION_STATE_RESET)
 
 
 def reset_all_state() -> None:
     """Reset all session state (for Start Over button)"""
-    reset_document_state()
-    reset_corpus_state()
-    reset_verification_state()
+    st.session_state.update(ALL_STATE_RESET)
@@ -11,86 +11,135 @@ Design Philosophy:
 - Fixed header/footer with scrollable content area
 """
 
+import hashlib
+import re
+from pathlib import Path
+from typing import Optional
 import streamlit as st
-
-
-def load_css():
-    """Load Firm-inspired design system CSS"""
-    st.markdown(
-        """
+from termcolor import cprint
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and layout whitespace so each rerun sends fewer bytes"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    # Whitespace next to block and declaration delimiters carries no meaning
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    # Space after a property colon, and the semicolon closing a block, are optional.
+    # Quoted strings are matched first and kept as-is: attribute selectors such as
+    # [style*="font-size: 0.875rem"] compare against the literal text.
+    css = re.sub(r"(\"[^\"]*\"|'[^']*')|:\s+", lambda m: m.group(1) or ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+# Fonts load through <link> tags rather than @import inside the stylesheet, so
+# the font CSS fetch doesn't block parsing of the rules behind it. Both families
+# come from a single request, and display=swap shows fallback text until they arrive.
+FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2'
+    # Only the weights the stylesheet uses (Lora is always set at 500 or heavier)
+    "?family=IBM+Plex+Sans:wght@400;500;600;700"
+    "&family=Lora:wght@500;600;700"
+    '&display=swap">'
+)
+
+CSS_VAR_PATTERN = re.compile(r"var\(--([\w-]+)\)")
+
+
+def resolve_css_vars(css: str, tokens: dict) -> str:
+    """Replace var(--token) references with their literal token values
+
+    The design tokens never change at runtime, so resolving them once at import
+    spares the browser a custom-property lookup per matched declaration.
+    """
+
+    def resolve(match: re.Match) -> str:
+        # Tokens may reference other tokens (e.g. --info)
+        return CSS_VAR_PATTERN.sub(resolve, tokens[match.group(1)])
+
+    return CSS_VAR_PATTERN.sub(resolve, css)
+
+
+# Files in frontend/static/ are served under app/static/ (server.enableStaticServing)
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_URL = "app/static"
+
+
+# Design tokens, substituted for var(--name) at import so the shipped CSS
+# carries only literal values and no :root custom-property block
+DESIGN_TOKENS = {
+    # Neutrals
+    "white": "#ffffff",
+    "cream-white": "#fafaf9",
+    "cream": "#f5f4f0",
+    "warm-gray-100": "#f8f7f5",
+    "warm-gray-200": "#e8e6e3",
+    "warm-gray-300": "#d4d2ce",
+    "warm-gray-400": "#c8c5c0",
+    "warm-gray-500": "#9b9690",
+    "charcoal": "#3d3935",
+    "black": "#1a1816",
+
+    # Firm Blues - Powder/Soft
+    "fm-blue-50": "#f7fbfd",
+    "fm-blue-100": "#e5f0f7",
+    "fm-blue-200": "#cce1ee",
+    "fm-blue-300": "#a4c8e1",
+    "fm-blue-400": "#7ba8c9",
+    "fm-blue-500": "#5a8fb5",
+
+    # Firm Green - Lime/Chartreuse
+    "fm-green-50": "#f9fced",
+    "fm-green-100": "#f0f7d6",
+    "fm-green-200": "#e3f0b8",
+    "fm-green-300": "#c8e86b",
+    "fm-green-400": "#b0d94f",
+    "fm-green-500": "#9ac93d",
+
+    # Gemini Brand
+    "gemini-blue-light": "#e8f4f8",
+    "gemini-blue": "#4fc3f7",
+    "gemini-blue-dark": "#0288d1",
+
+    # Semantic
+    "success": "#059669",
+    "warning": "#f59e0b",
+    "error": "#dc2626",
+    "info": "var(--gemini-blue)",
+
+    # Typography
+    "font-display": "'Lora', 'Georgia', serif",
+    "font-body": "'IBM Plex Sans', -apple-system, BlinkMacSystemFont, sans-serif",
+
+    # Spacing Scale (8px base)
+    "space-1": "0.5rem",  # 8px
+    "space-2": "1rem",  # 16px
+    "space-3": "1.5rem",  # 24px
+    "space-4": "2rem",  # 32px
+    "space-5": "2.5rem",  # 40px
+    "space-6": "3rem",  # 48px
+    "space-8": "4rem",  # 64px
+
+    # Radius
+    "radius-sm": "0.375rem",
+    "radius-md": "0.5rem",
+    "radius-lg": "1rem",
+    "radius-xl": "1.5rem",
+    "radius-full": "9999px",
+
+    # Shadows
+    "shadow-xs": "0 1px 2px rgba(0, 0, 0, 0.04)",
+    "shadow-sm": "0 1px 3px rgba(0, 0, 0, 0.06)",
+    "shadow-md": "0 4px 8px rgba(0, 0, 0, 0.08)",
+    "shadow-lg": "0 10px 24px rgba(0, 0, 0, 0.1)",
+}
+
+# Core design system, resolved and minified once at import (see below)
+FIRM_CSS_SOURCE = """
 <style>
-    /* ===== FONTS ===== */
-    @import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@300;400;500;600;700&display=swap');
-    @import url('https://fonts.googleapis.com/css2?family=Lora:wght@400;500;600;700&display=swap');
-
-    /* ===== COLOR SYSTEM - FRESHFIELDS ===== */
-    :root {
-        /* Neutrals */
-        --white: #ffffff;
-        --cream-white: #fafaf9;
-        --cream: #f5f4f0;
-        --warm-gray-100: #f8f7f5;
-        --warm-gray-200: #e8e6e3;
-        --warm-gray-300: #d4d2ce;
-        --warm-gray-400: #c8c5c0;
-        --warm-gray-500: #9b9690;
-        --charcoal: #3d3935;
-        --black: #1a1816;
-
-        /* Firm Blues - Powder/Soft */
-        --fm-blue-50: #f7fbfd;
-        --fm-blue-100: #e5f0f7;
-        --fm-blue-200: #cce1ee;
-        --fm-blue-300: #a4c8e1;
-        --fm-blue-400: #7ba8c9;
-        --fm-blue-500: #5a8fb5;
-
-        /* Firm Green - Lime/Chartreuse */
-        --fm-green-50: #f9fced;
-        --fm-green-100: #f0f7d6;
-        --fm-green-200: #e3f0b8;
-        --fm-green-300: #c8e86b;
-        --fm-green-400: #b0d94f;
-        --fm-green-500: #9ac93d;
-
-        /* Gemini Brand */
-        --gemini-blue-light: #e8f4f8;
-        --gemini-blue: #4fc3f7;
-        --gemini-blue-dark: #0288d1;
-
-        /* Semantic */
-        --success: #059669;
-        --warning: #f59e0b;
-        --error: #dc2626;
-        --info: var(--gemini-blue);
-
-        /* Typography */
-        --font-display: 'Lora', 'Georgia', serif;
-        --font-body: 'IBM Plex Sans', -apple-system, BlinkMacSystemFont, sans-serif;
-
-        /* Spacing Scale (8px base) */
-        --space-1: 0.5rem;   /* 8px */
-        --space-2: 1rem;     /* 16px */
-        --space-3: 1.5rem;   /* 24px */
-        --space-4: 2rem;     /* 32px */
-        --space-5: 2.5rem;   /* 40px */
-        --space-6: 3rem;     /* 48px */
-        --space-8: 4rem;     /* 64px */
-
-        /* Radius */
-        --radius-sm: 0.375rem;
-        --radius-md: 0.5rem;
-        --radius-lg: 1rem;
-        --radius-xl: 1.5rem;
-        --radius-full: 9999px;
-
-        /* Shadows */
-        --shadow-xs: 0 1px 2px rgba(0, 0, 0, 0.04);
-        --shadow-sm: 0 1px 3px rgba(0, 0, 0, 0.06);
-        --shadow-md: 0 4px 8px rgba(0, 0, 0, 0.08);
-        --shadow-lg: 0 10px 24px rgba(0, 0, 0, 0.1);
-    }
-
     /* ===== GLOBAL RESETS ===== */
     .main {
         background: var(--cream-white) !important;
@@ -156,14 +205,15 @@ def load_css():
         align-items: center;
         gap: 0.625rem;
         padding: 0.625rem 1.5rem;
-        background: linear-gradient(135deg, var(--gemini-blue-light) 0%, var(--white) 100%);
+        /* Static SVG gradient (gemini-blue-light to white): decoded once, then blitted */
+        background: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1 1' preserveAspectRatio='none'%3E%3ClinearGradient id='g' x2='1' y2='1'%3E%3Cstop stop-color='%23e8f4f8'/%3E%3Cstop offset='1' stop-color='%23fff'/%3E%3C/linearGradient%3E%3Crect width='1' height='1' fill='url(%23g)'/%3E%3C/svg%3E") center / 100% 100% no-repeat;
         border: 2px solid var(--gemini-blue-dark);
         border-radius: var(--radius-full);
         font-size: 0.875rem;
         font-weight: 600;
         color: var(--gemini-blue-dark);
         box-shadow: var(--shadow-sm);
-        transition: all 0.3s ease;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
     }
 
     .fm-gemini-badge:hover {
@@ -172,45 +222,35 @@ def load_css():
     }
 
     /* ===== SIDEBAR COLUMN ===== */
-    /* Target the column containing sidebar content - shaded box */
-    [data-testid="stColumn"]:has(.fm-sidebar-content) {
+    /* Shaded box on the keyed container that fills the sidebar column.
+       Matching the key class directly avoids a :has() lookup on every column,
+       which Chromium re-evaluates on each DOM mutation. */
+    .st-key-fm_sidebar_content {
         background: var(--fm-blue-100) !important;
         min-height: calc(100vh - 160px);
+        /* Keep sidebar reflows and repaints from invalidating the main column */
+        contain: layout paint;
         padding: var(--space-3) var(--space-4) var(--space-4) var(--space-4) !important;
         border-radius: var(--radius-lg);
         box-sizing: border-box !important;
     }
 
-    /* Ensure all child divs of sidebar column also have blue background */
-    [data-testid="stColumn"]:has(.fm-sidebar-content) > div,
-    [data-testid="stColumn"]:has(.fm-sidebar-content) > div > div {
-        background: var(--fm-blue-100) !important;
+    /* Action button spacing (was a page-wide div:has(button) rule in corpus.py) */
+    .st-key-fm_sidebar_content .stButton {
+        margin-bottom: 0.25rem !important;
     }
 
     /* Sidebar content - no extra padding needed, column handles it */
     .fm-sidebar-content {
-        padding: 0 !important;
-        margin: 0 !important;
-        box-sizing: border-box !important;
+        padding: 0;
+        margin: 0;
+        box-sizing: border-box;
     }
 
-    /* ULTRA NUCLEAR OPTION: Force ALL elements in sidebar to have transparent backgrounds */
-    .fm-sidebar-content *,
-    .fm-sidebar-content div,
-    .fm-sidebar-content [data-testid="stColumn"],
-    .fm-sidebar-content [data-testid="stColumn"] *,
-    .fm-sidebar-content [data-testid="stColumn"] div,
-    .fm-sidebar-content [data-testid="stVerticalBlock"],
-    .fm-sidebar-content [data-testid="stVerticalBlock"] *,
-    .fm-sidebar-content [data-testid="stVerticalBlock"] div,
-    .fm-sidebar-content [data-testid="stHorizontalBlock"],
-    .fm-sidebar-content [data-testid="stHorizontalBlock"] *,
-    .fm-sidebar-content [data-testid="stHorizontalBlock"] div,
-    .fm-sidebar-content [data-testid="element-container"],
-    .fm-sidebar-content [data-testid="element-container"] *,
-    .fm-sidebar-content .element-container,
-    .fm-sidebar-content .element-container * {
-        background-color: transparent !important;
+    /* Everything inside the sidebar sits on the shaded box; the universal
+       child selector already covers every nested column, block and metric */
+    .fm-sidebar-content,
+    .fm-sidebar-content * {
         background: transparent !important;
     }
 
@@ -230,51 +270,6 @@ def load_css():
        using the .st-key-{key_name} selector pattern instead.
     */
 
-    /* ===== FIX: Key-based targeting for sidebar metrics ===== */
-    /* Use .st-key-{key_name} pattern to target specific widgets */
-
-    /* Target the columns container */
-    .st-key-sidebar_metrics_cols,
-    .st-key-sidebar_metrics_cols > div,
-    .st-key-sidebar_metrics_cols [data-testid="stColumn"],
-    .st-key-sidebar_metrics_cols [data-testid="stColumn"] > div,
-    .st-key-sidebar_metrics_cols [data-testid="stVerticalBlock"],
-    .st-key-sidebar_metrics_cols [data-testid="stVerticalBlock"] > div {
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
-    /* Target individual metrics */
-    .st-key-sidebar_metric_docs,
-    .st-key-sidebar_metric_storage,
-    .st-key-sidebar_metric_pages,
-    .st-key-sidebar_metric_chunks {
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
-    /* Target all descendants of keyed metrics */
-    .st-key-sidebar_metric_docs *,
-    .st-key-sidebar_metric_storage *,
-    .st-key-sidebar_metric_pages *,
-    .st-key-sidebar_metric_chunks * {
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
-    /* Target metric-specific containers */
-    .st-key-sidebar_metric_docs [data-testid="stMetric"],
-    .st-key-sidebar_metric_storage [data-testid="stMetric"],
-    .st-key-sidebar_metric_pages [data-testid="stMetric"],
-    .st-key-sidebar_metric_chunks [data-testid="stMetric"],
-    .st-key-sidebar_metric_docs [data-testid="stMetric"] > div,
-    .st-key-sidebar_metric_storage [data-testid="stMetric"] > div,
-    .st-key-sidebar_metric_pages [data-testid="stMetric"] > div,
-    .st-key-sidebar_metric_chunks [data-testid="stMetric"] > div {
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
     /* Tighter button spacing - override any parent spacing */
     .fm-sidebar-content .stButton > button {
         margin-bottom: 0 !important;
@@ -293,36 +288,6 @@ def load_css():
     /* Sidebar column gap for metrics - nested columns only */
     .fm-sidebar-content [data-testid="stColumn"] {
         padding: 0 var(--space-1) !important;
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
-    /* Force all children of nested columns to be transparent */
-    .fm-sidebar-content [data-testid="stColumn"] > *,
-    .fm-sidebar-content [data-testid="stColumn"] > div,
-    .fm-sidebar-content [data-testid="stColumn"] > div > *,
-    .fm-sidebar-content [data-testid="stColumn"] [data-testid="stVerticalBlock"],
-    .fm-sidebar-content [data-testid="stColumn"] [data-testid="stVerticalBlock"] > *,
-    .fm-sidebar-content [data-testid="stColumn"] [data-testid="stVerticalBlock"] > div,
-    .fm-sidebar-content [data-testid="stColumn"] [data-testid="stVerticalBlock"] > div > * {
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
-    /* Target vertical blocks inside nested columns within sidebar - NUCLEAR OVERRIDE */
-    .fm-sidebar-content [data-testid="stColumn"] [data-testid="stVerticalBlock"],
-    .fm-sidebar-content [data-testid="stHorizontalBlock"] [data-testid="stColumn"] [data-testid="stVerticalBlock"],
-    .fm-sidebar-content > div > [data-testid="stHorizontalBlock"] > div > [data-testid="stColumn"] > div > [data-testid="stVerticalBlock"] {
-        background: transparent !important;
-        background-color: transparent !important;
-    }
-
-    /* Also target the stMetric divs themselves */
-    .fm-sidebar-content [data-testid="stMetric"],
-    .fm-sidebar-content [data-testid="stMetric"] > div,
-    .fm-sidebar-content [data-testid="stMetric"] > div > div {
-        background: transparent !important;
-        background-color: transparent !important;
     }
 
     .fm-sidebar-content > div > [data-testid="stColumn"]:first-child {
@@ -337,13 +302,9 @@ def load_css():
     .fm-sidebar-content h2:first-of-type {
         margin-top: 0 !important;
         padding-top: 0 !important;
-        margin-bottom: var(--space-1) !important;
-    }
-
-    .fm-sidebar-content h2 {
-        margin-bottom: var(--space-1) !important;
     }
 
+    .fm-sidebar-content h2,
     .fm-sidebar-content h3 {
         margin-bottom: var(--space-1) !important;
     }
@@ -374,21 +335,39 @@ def load_css():
         margin-bottom: var(--space-1) !important;
     }
 
+    /* Hide scrollbar for the case context text area while keeping resize capability */
+    .st-key-case_context_sidebar textarea {
+        overflow: hidden !important;
+        resize: vertical !important;
+        scrollbar-width: none !important; /* Firefox */
+        -ms-overflow-style: none !important; /* IE and Edge */
+    }
+
+    .st-key-case_context_sidebar textarea::-webkit-scrollbar {
+        display: none !important; /* Chrome, Safari, Opera */
+    }
+
+    /* Remove extra margin below text area */
+    .st-key-case_context_sidebar div[data-testid="stTextArea"] {
+        margin-bottom: 0 !important;
+    }
+
     /* ===== MAIN CONTENT COLUMN ===== */
     /* Main content column padding - apply to the column itself */
     [data-testid="stColumn"]:nth-child(2) {
         background: var(--white);
     }
 
-    /* Main content - container provides horizontal padding */
+    /* Main content - container provides horizontal padding.
+       Rules on our own .fm-* markup skip !important: no Streamlit style competes */
     .fm-main-content {
-        padding-top: var(--space-1) !important;
-        padding-bottom: var(--space-6) !important;
-        padding-left: var(--space-3) !important;
-        padding-right: 0 !important;
-        margin: 0 !important;
+        padding-top: var(--space-1);
+        padding-bottom: var(--space-6);
+        padding-left: var(--space-3);
+        padding-right: 0;
+        margin: 0;
         background: var(--white);
-        box-sizing: border-box !important;
+        box-sizing: border-box;
     }
 
     /* Remove top margin/padding from first elements */
@@ -397,7 +376,9 @@ def load_css():
         padding-top: 0 !important;
     }
 
-    .fm-main-content h2:first-of-type {
+    /* First heading in main content - eliminate top gap */
+    .fm-main-content h2:first-of-type,
+    .fm-main-content h3:first-of-type {
         margin-top: 0 !important;
         padding-top: 0 !important;
     }
@@ -416,93 +397,6 @@ def load_css():
         padding-right: 0 !important;
     }
 
-    /* Card container styling - COMPACT & EFFICIENT */
-    .fm-card {
-        background: var(--white);
-        border: 2px solid var(--warm-gray-200);
-        border-radius: var(--radius-lg);
-        padding: var(--space-3);
-        min-height: 200px;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow: var(--shadow-xs);
-        display: flex;
-        flex-direction: column;
-    }
-
-    .fm-card:hover {
-        border-color: var(--warm-gray-300);
-        box-shadow: var(--shadow-md);
-        transform: translateY(-2px);
-    }
-
-    .fm-card-number {
-        font-family: var(--font-display);
-        font-size: 0.875rem;
-        font-weight: 500;
-        color: var(--warm-gray-500);
-        margin-bottom: var(--space-2);
-        letter-spacing: 0.05em;
-    }
-
-    .fm-card-title {
-        font-family: var(--font-display);
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: var(--black);
-        margin-bottom: var(--space-2);
-        letter-spacing: -0.01em;
-        line-height: 1.3 !important;
-    }
-
-    /* Compact spacing within cards */
-    .fm-card .stMarkdown {
-        margin-bottom: var(--space-2) !important;
-    }
-
-    .fm-card .stRadio {
-        margin-top: var(--space-1) !important;
-        margin-bottom: var(--space-2) !important;
-    }
-
-    .fm-card .stSelectbox {
-        margin-bottom: var(--space-2) !important;
-    }
-
-    .fm-card .stFileUploader {
-        margin-top: var(--space-1) !important;
-        margin-bottom: var(--space-2) !important;
-    }
-
-    .fm-card .stButton {
-        margin-top: var(--space-1) !important;
-    }
-
-    /* Gemini Card - Special Treatment */
-    .fm-gemini-card {
-        background: linear-gradient(135deg, var(--gemini-blue-light) 0%, var(--white) 50%, var(--white) 100%);
-        border: 2.5px solid var(--gemini-blue);
-        box-shadow: 0 0 0 4px rgba(79, 195, 247, 0.1);
-        position: relative;
-        overflow: hidden;
-    }
-
-    .fm-gemini-card::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(79, 195, 247, 0.08) 0%, transparent 70%);
-        pointer-events: none;
-    }
-
-    .fm-gemini-card:hover {
-        border-color: var(--gemini-blue-dark);
-        box-shadow: 0 0 0 4px rgba(79, 195, 247, 0.2), var(--shadow-lg);
-        transform: translateY(-3px);
-    }
-
     /* ===== BUTTONS - MORE COMPACT ===== */
     .stButton > button {
         border-radius: var(--radius-full) !important;
@@ -510,7 +404,9 @@ def load_css():
         font-weight: 600 !important;
         padding: 0.625rem 1.5rem !important;
         font-size: 0.875rem !important;
-        transition: all 0.25s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        transition-property: transform, box-shadow, background, border-color !important;
+        transition-duration: 0.25s !important;
+        transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1) !important;
         border: none !important;
         letter-spacing: 0.01em !important;
         box-shadow: var(--shadow-sm) !important;
@@ -550,7 +446,7 @@ def load_css():
         border-radius: var(--radius-md) !important;
         background: var(--white) !important;
         padding: var(--space-2) !important;
-        transition: all 0.3s ease !important;
+        transition: border-color 0.3s ease, background 0.3s ease !important;
     }
 
     .stFileUploader:hover {
@@ -596,7 +492,7 @@ def load_css():
         border-radius: var(--radius-md) !important;
         border: 2px solid var(--warm-gray-200) !important;
         font-family: var(--font-body) !important;
-        transition: all 0.2s ease !important;
+        transition: border-color 0.2s ease, box-shadow 0.2s ease !important;
         font-size: 0.9375rem !important;
     }
 
@@ -609,7 +505,7 @@ def load_css():
     .stSelectbox > div > div {
         border-radius: var(--radius-md) !important;
         border: 2px solid var(--warm-gray-200) !important;
-        transition: all 0.2s ease !important;
+        transition: border-color 0.2s ease !important;
     }
 
     .stSelectbox > div > div:hover {
@@ -637,7 +533,8 @@ def load_css():
         background: var(--cream-white) !important;
         border: 1.5px solid var(--warm-gray-200) !important;
         padding: var(--space-2) var(--space-3) !important;
-        transition: all 0.2s ease !important;
+        margin-bottom: var(--space-2) !important;
+        transition: background 0.2s ease, border-color 0.2s ease !important;
     }
 
     .streamlit-expanderHeader:hover {
@@ -645,6 +542,13 @@ def load_css():
         border-color: var(--warm-gray-300) !important;
     }
 
+    /* The debug JSON tree sits below the fold of the Streamlit sidebar; skip its
+       layout and paint until it is scrolled into view */
+    [data-testid="stSidebar"] [data-testid="stExpanderDetails"] {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 200px;
+    }
+
     /* ===== DIVIDER ===== */
     hr {
         border: none !important;
@@ -662,14 +566,6 @@ def load_css():
         line-height: 1.5 !important;
     }
 
-    /* Sidebar alerts - compact */
-    .fm-sidebar-content .stSuccess,
-    .fm-sidebar-content .stInfo,
-    .fm-sidebar-content .stWarning {
-        padding: var(--space-2) var(--space-3) !important;
-        margin-bottom: var(--space-2) !important;
-    }
-
     /* ===== SPACING UTILITIES ===== */
     .element-container {
         margin-bottom: var(--space-2);
@@ -682,17 +578,9 @@ def load_css():
         line-height: 1.2 !important;
     }
 
-    /* First heading in main content - eliminate top gap */
-    .fm-main-content > .element-container:first-child h2,
-    .fm-main-content > .element-container:first-child h3 {
-        margin-top: 0 !important;
-        padding-top: 0 !important;
-    }
-
     .stMarkdown h3 {
         margin-top: var(--space-3) !important;
         margin-bottom: var(--space-2) !important;
-        line-height: 1.3 !important;
     }
 
     /* Compact spacing after info/success/warning boxes */
@@ -700,13 +588,10 @@ def load_css():
         margin-bottom: var(--space-3) !important;
     }
 
-    /* Compact spacing between metrics */
-    .stMetric {
-        margin-bottom: var(--space-2) !important;
-    }
-
-    /* Compact spacing for file uploaders */
-    .stFileUploader {
+    /* Compact spacing between metrics, file uploaders and buttons (applies in cards too) */
+    .stMetric,
+    .stFileUploader,
+    .stButton {
         margin-bottom: var(--space-2) !important;
     }
 
@@ -715,32 +600,17 @@ def load_css():
         margin-bottom: var(--space-3) !important;
     }
 
-    /* Compact spacing between buttons */
-    .stButton {
-        margin-bottom: var(--space-2) !important;
-    }
-
     /* Main content section spacing */
     .fm-main-content > .element-container {
         margin-bottom: var(--space-3) !important;
     }
 
-    /* Results section spacing */
-    .fm-main-content .stMetric {
-        margin-bottom: var(--space-2) !important;
-    }
-
     /* Progress bars - compact */
     .stProgress {
         margin-bottom: var(--space-2) !important;
         margin-top: var(--space-1) !important;
     }
 
-    /* Expander spacing */
-    .streamlit-expanderHeader {
-        margin-bottom: var(--space-2) !important;
-    }
-
     /* Caption spacing */
     .stMarkdown p[style*="font-size: 0.875rem"],
     .stCaption {
@@ -791,6 +661,191 @@ def load_css():
         font-size: 0.875rem;
     }
 </style>
-""",
-        unsafe_allow_html=True,
-    )
+"""
+
+# Workflow card styles, only sent on runs that render the cards
+CARD_CSS_SOURCE = """
+<style>
+    /* Card container styling - COMPACT & EFFICIENT */
+    .fm-card {
+        background: var(--white);
+        border: 2px solid var(--warm-gray-200);
+        border-radius: var(--radius-lg);
+        padding: var(--space-3);
+        min-height: 200px;
+        transition-property: transform, border-color;
+        transition-duration: 0.3s;
+        transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
+        box-shadow: var(--shadow-xs);
+        display: flex;
+        flex-direction: column;
+        position: relative;
+        /* Layout only: paint containment would clip the hover shadow below */
+        contain: layout;
+    }
+
+    /* The hover shadow is pre-rendered on a pseudo-element and faded in, so the
+       animation only changes opacity instead of repainting a shadow each frame */
+    .fm-card::after {
+        content: "";
+        position: absolute;
+        inset: -2px;
+        border-radius: inherit;
+        box-shadow: var(--shadow-md);
+        opacity: 0;
+        transition: opacity 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        pointer-events: none;
+    }
+
+    .fm-card:hover {
+        border-color: var(--warm-gray-300);
+        transform: translateY(-2px);
+    }
+
+    .fm-card:hover::after {
+        opacity: 1;
+    }
+
+    .fm-card-number {
+        font-family: var(--font-display);
+        font-size: 0.875rem;
+        font-weight: 500;
+        color: var(--warm-gray-500);
+        margin-bottom: var(--space-2);
+        letter-spacing: 0.05em;
+    }
+
+    .fm-card-title {
+        font-family: var(--font-display);
+        font-size: 1.25rem;
+        font-weight: 600;
+        color: var(--black);
+        margin-bottom: var(--space-2);
+        letter-spacing: -0.01em;
+        line-height: 1.3;
+    }
+
+    /* Compact spacing within cards */
+    .fm-card .stMarkdown {
+        margin-bottom: var(--space-2) !important;
+    }
+
+    .fm-card .stRadio {
+        margin-top: var(--space-1) !important;
+        margin-bottom: var(--space-2) !important;
+    }
+
+    .fm-card .stSelectbox {
+        margin-bottom: var(--space-2) !important;
+    }
+
+    /* Bottom margin for both comes from the shared widget rule in FIRM_CSS */
+    .fm-card .stFileUploader,
+    .fm-card .stButton {
+        margin-top: var(--space-1) !important;
+    }
+
+    /* Gemini Card - Special Treatment */
+    /* The glow is a static square SVG rather than a CSS radial-gradient, so the
+       decoded image is reused instead of re-rasterized per paint. Sized with
+       cover it stays circular, fading out about one card width from the centre
+       (close to the old 140%-of-corner radius on these near-square cards). */
+    .fm-gemini-card {
+        background:
+            url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 1 1'%3E%3CradialGradient id='g' r='1'%3E%3Cstop stop-color='%234fc3f7' stop-opacity='.08'/%3E%3Cstop offset='1' stop-color='%234fc3f7' stop-opacity='0'/%3E%3C/radialGradient%3E%3Crect width='1' height='1' fill='url(%23g)'/%3E%3C/svg%3E") center / cover no-repeat,
+            linear-gradient(135deg, var(--gemini-blue-light) 0%, var(--white) 50%, var(--white) 100%);
+        border: 2.5px solid var(--gemini-blue);
+        box-shadow: 0 0 0 4px rgba(79, 195, 247, 0.1);
+    }
+
+    .fm-gemini-card::after {
+        inset: -2.5px;
+        box-shadow: 0 0 0 4px rgba(79, 195, 247, 0.2), var(--shadow-lg);
+    }
+
+    .fm-gemini-card:hover {
+        border-color: var(--gemini-blue-dark);
+        transform: translateY(-3px);
+    }
+
+    /* Pre-promote the few hover-lifted blocks so the first hover doesn't jank.
+       Buttons are left out: a page can render dozens and each layer costs memory. */
+    @media (hover: hover) {
+        .fm-card,
+        .fm-gemini-badge {
+            will-change: transform;
+        }
+    }
+</style>
+"""
+
+# Built once at import; every rerun passes the same strings to st.markdown
+FIRM_CSS = minify_css(resolve_css_vars(FIRM_CSS_SOURCE, DESIGN_TOKENS))
+CARD_CSS = minify_css(resolve_css_vars(CARD_CSS_SOURCE, DESIGN_TOKENS))
+
+
+# First release whose app/static route sends .css as text/css. Earlier servers send
+# file types outside their image/font safe-list as text/plain with nosniff, which
+# browsers refuse to apply as a stylesheet.
+STATIC_CSS_MIN_STREAMLIT = (1, 57)
+
+
+def static_css_supported() -> bool:
+    """Whether app/static is enabled and this Streamlit serves .css as a stylesheet"""
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    major, minor = (int(part) for part in st.__version__.split(".")[:2])
+    return (major, minor) >= STATIC_CSS_MIN_STREAMLIT
+
+
+def publish_stylesheet(name: str, css: str) -> Optional[str]:
+    """Write a built <style> block to the static folder and return its URL
+
+    The filename carries a content hash, so browsers can cache it and a changed
+    stylesheet gets a new URL; files left by earlier builds of the same sheet are
+    removed. Returns None when static serving is off, can't serve CSS, or the
+    folder isn't writable, in which case the CSS stays inline.
+    """
+    if not static_css_supported():
+        return None
+
+    body = css.removeprefix("<style>").removesuffix("</style>")
+    filename = f"{name}-{hashlib.sha256(body.encode('utf-8')).hexdigest()[:12]}.css"
+    path = STATIC_DIR / filename
+    try:
+        if not path.is_file():
+            STATIC_DIR.mkdir(exist_ok=True)
+            path.write_text(body, encoding="utf-8")
+        stale = re.compile(rf"{re.escape(name)}-[0-9a-f]{{12}}\.css")
+        for old in STATIC_DIR.glob(f"{name}-*.css"):
+            if old != path and stale.fullmatch(old.name):
+                old.unlink(missing_ok=True)
+    except OSError as e:
+        cprint(f"[FRONTEND] Could not publish {filename}, inlining CSS: {e}", "yellow")
+        return None
+    return f"{STATIC_URL}/{filename}"
+
+
+def stylesheet_html(name: str, css: str) -> str:
+    """Return a <link> to the published stylesheet, or the inline <style> block"""
+    url = publish_stylesheet(name, css)
+    return f'<link rel="stylesheet" href="{url}">' if url else css
+
+
+# Reruns send a short <link> instead of the whole stylesheet over the websocket
+FIRM_HTML = FONT_LINKS + stylesheet_html("firm", FIRM_CSS)
+CARD_HTML = stylesheet_html("firm-cards", CARD_CSS)
+
+
+def load_css():
+    """Load Firm-inspired design system CSS
+
+    Must be called on every rerun: Streamlit drops elements a run doesn't emit,
+    so a once-per-session guard would strip the styles after the first click.
+    """
+    st.markdown(FIRM_HTML, unsafe_allow_html=True)
+
+
+def load_card_css():
+    """Load the workflow card styles; call on each run that renders the cards"""
+    st.markdown(CARD_HTML, unsafe_allow_html=True)
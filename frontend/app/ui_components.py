@@ -2,6 +2,7 @@
 Reusable UI Components for Content Verification Tool
 """
 
+from typing import Any, Dict, List, Tuple
 import streamlit as st
 from .config import BACKEND_URL, MAX_FILE_SIZE_MB, FEATURES
 from .api_client import check_backend_health, reset_verification
@@ -38,44 +39,47 @@ def render_backend_status() -> None:
             # Streamlit will automatically rerun when cache is cleared
 
 
+# The About text only depends on configuration, so it's formatted once at import.
+# Streamlit renders Markdown in the browser; each run just sends this string.
+SIDEBAR_ABOUT_MARKDOWN = f"""
+### Features
+- **Document Upload**: PDF or DOCX files (max {MAX_FILE_SIZE_MB} MB)
+- **AI Verification**: Upload reference documents for automated verification
+- **Splitting modes**:
+  - Paragraph-level (default)
+  - Sentence-level
+- **Output Formats**:
+  - Word (Landscape)
+  - Word (Portrait)
+  - Excel
+  - CSV
+  - JSON (with verification metadata)
+
+### How It Works
+1. (Optional) Create AI reference corpus
+2. Upload your document
+3. Select splitting mode
+4. Run AI verification (if corpus active)
+5. Choose output format
+6. Generate and download
+
+### Output Structure
+Each verification table contains:
+- Page #
+- Item #
+- Text
+- Verified ☑
+- Verification Score
+- Verification Source
+- Verification Note
+"""
+
+
 def render_sidebar() -> None:
     """Render the sidebar with information and controls"""
     with st.sidebar:
         st.header("ℹ️ About")
-        st.markdown(
-            f"""
-        ### Features
-        - **Document Upload**: PDF or DOCX files (max {MAX_FILE_SIZE_MB} MB)
-        - **AI Verification**: Upload reference documents for automated verification
-        - **Splitting modes**:
-          - Paragraph-level (default)
-          - Sentence-level
-        - **Output Formats**:
-          - Word (Landscape)
-          - Word (Portrait)
-          - Excel
-          - CSV
-          - JSON (with verification metadata)
-
-        ### How It Works
-        1. (Optional) Create AI reference corpus
-        2. Upload your document
-        3. Select splitting mode
-        4. Run AI verification (if corpus active)
-        5. Choose output format
-        6. Generate and download
-
-        ### Output Structure
-        Each verification table contains:
-        - Page #
-        - Item #
-        - Text
-        - Verified ☑
-        - Verification Score
-        - Verification Source
-        - Verification Note
-        """
-        )
+        st.markdown(SIDEBAR_ABOUT_MARKDOWN)
 
         # Reset functionality
         st.divider()
@@ -89,25 +93,24 @@ def render_sidebar() -> None:
         if FEATURES["show_debug_info"]:
             st.divider()
             with st.expander("🔍 Debug Information", key="debug_info_expander"):
-                st.json(
-                    {
-                        "document_id": st.session_state.document_id,
-                        "document_info": st.session_state.document_info,
-                        "upload_in_progress": st.session_state.upload_in_progress,
-                        "has_generated": st.session_state.last_generated is not None,
-                        "corpus_active": st.session_state.reference_docs_uploaded,
-                        "store_id": st.session_state.store_id,
-                        "verification_complete": st.session_state.verification_complete,
-                    }
-                )
-
-
-def render_footer() -> None:
-    """Render the Firm-inspired footer with connection status"""
-    from .api_client import check_backend_health
-
-    # Check backend health status
-    backend_healthy = check_backend_health()
+                # Expander bodies run even when collapsed, so the payload is only
+                # built and sent once the checkbox is ticked
+                if st.checkbox("Show debug JSON", key="debug_info_show"):
+                    st.json(
+                        {
+                            "document_id": st.session_state.document_id,
+                            "document_info": st.session_state.document_info,
+                            "upload_in_progress": st.session_state.upload_in_progress,
+                            "has_generated": st.session_state.last_generated is not None,
+                            "corpus_active": st.session_state.reference_docs_uploaded,
+                            "store_id": st.session_state.store_id,
+                            "verification_complete": st.session_state.verification_complete,
+                        }
+                    )
+
+
+def render_footer(backend_healthy: bool) -> None:
+    """Render the Firm-inspired footer with this run's backend connection status"""
     status_indicator = "🟢 Connected" if backend_healthy else "🔴 Disconnected"
     status_class = (
         "fm-status-connected" if backend_healthy else "fm-status-disconnected"
@@ -130,38 +133,66 @@ def render_footer() -> None:
     )
 
 
-def render_verification_results_summary() -> None:
-    """Render verification results summary section"""
-    if not st.session_state.verification_complete:
-        return
+def confidence_buckets(chunks: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """Count verified chunks by score band (low <5, medium 5-7, high 8-10) in one pass"""
+    counts = [0, 0, 0]
+    for chunk in chunks:
+        score = chunk.get("verification_score")
+        if chunk.get("verified") and score:
+            counts[0 if score < 5 else 1 if score < 8 else 2] += 1
+    return counts[0], counts[1], counts[2]
 
-    st.divider()
-    st.header("📊 Verification Results Summary")
 
-    results = st.session_state.verification_results
-    verified_count = results.get("total_verified", 0)
+def summarize_verification(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the counts the results views display, once per verification run"""
+    chunks = results.get("verified_chunks") or []
     total_count = results.get("total_chunks", 0)
-    unverified_count = total_count - verified_count
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.success(f"✅ **Verified:** {verified_count} chunks")
-    with col2:
-        st.warning(f"⚠️ **Unverified:** {unverified_count} chunks")
+    verified_count = results.get("total_verified", 0)
+    scores = [
+        c["verification_score"]
+        for c in chunks
+        if c.get("verified") and c.get("verification_score")
+    ]
+    return {
+        "total": total_count,
+        "verified": verified_count,
+        "unverified": total_count - verified_count,
+        "verified_pct": (verified_count / total_count * 100) if total_count > 0 else 0,
+        "avg_score": sum(scores) / len(scores) if scores else 0,
+        "buckets": confidence_buckets(chunks),
+    }
+
+
+@st.fragment
+def render_verification_results_summary() -> None:
+    """Render verification results summary section
 
-    # Show confidence breakdown
-    if results.get("verified_chunks"):
-        scores = [
-            c.get("verification_score", 0)
-            for c in results["verified_chunks"]
-            if c.get("verified") and c.get("verification_score")
-        ]
+    Uses @st.fragment so a Reset Verification click reruns only this section;
+    the full-page rerun happens once, from st.rerun() after the reset succeeds.
+    """
+    summary = st.session_state.get("verification_summary")
+    if not summary:
+        return
 
-        if scores:
-            low_confidence = sum(1 for s in scores if s < 5)
-            medium_confidence = sum(1 for s in scores if 5 <= s < 8)
-            high_confidence = sum(1 for s in scores if s >= 8)
+    st.divider()
+    st.header("📊 Verification Results Summary")
 
+    if summary["total"] == 0:
+        # Nothing was split out of the document, so skip the metric widgets
+        st.info("No chunks to summarize.")
+    else:
+        verified_count = summary["verified"]
+        unverified_count = summary["unverified"]
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.success(f"✅ **Verified:** {verified_count} chunks")
+        with col2:
+            st.warning(f"⚠️ **Unverified:** {unverified_count} chunks")
+
+        # Show confidence breakdown
+        low_confidence, medium_confidence, high_confidence = summary["buckets"]
+        if low_confidence or medium_confidence or high_confidence:
             st.markdown("**Confidence Distribution:**")
             col1, col2, col3 = st.columns(3)
             with col1:
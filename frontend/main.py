@@ -14,25 +14,35 @@ st.set_page_config(
 )
 
 # Then other imports
-import os
+import gc
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from termcolor import cprint
 
 # Import application modules
 from app.config import (
     validate_backend_url,
+    BACKEND_URL,
     SUPPORTED_FILE_TYPES,
     MAX_FILE_SIZE_MB,
     OUTPUT_FORMAT_LABELS,
-    FORMAT_DESCRIPTIONS,
+    OUTPUT_FORMAT_SHORT_LABELS,
     MIME_TYPES,
+    DEBUG,
+)
+from app.state import (
+    init_session_state,
+    reset_verification_state,
 )
-from app.state import init_session_state
 from app.api_client import (
+    BackendError,
     upload_document,
     export_document,
     download_document,
     execute_verification,
+    check_backend_health,
+    reset_verification,
     validate_upload_response,
     validate_export_response,
 )
@@ -41,18 +51,41 @@ from app.ui_components import (
     render_backend_status,
     render_sidebar,
     render_footer,
+    summarize_verification,
 )
-from app.styles import load_css
+from app.styles import load_css, load_card_css
 from app.corpus import render_corpus_sidebar
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO if os.getenv("DEBUG") != "true" else logging.DEBUG,
+    level=logging.DEBUG if DEBUG else logging.INFO,
     format="[%(levelname)s] %(message)s",
 )
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(show_spinner=False)
+def freeze_startup_objects() -> None:
+    """Exclude import-time objects from garbage collection, once per process
+
+    Streamlit, requests and the app modules are long-lived; freezing them keeps
+    full collections triggered mid-rerun from rescanning them every time.
+    """
+    gc.freeze()
+
+
+freeze_startup_objects()
+
+# Seconds between status checks while a verification is running
+VERIFY_POLL_INTERVAL = 1.0
+
+
+@st.cache_resource(show_spinner=False)
+def get_verify_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for verification calls (main.py itself re-executes every rerun)"""
+    return ThreadPoolExecutor(max_workers=2)
+
+
 # Removed render_corpus_tab() - using single-screen layout now
 
 
@@ -72,8 +105,11 @@ def render_upload_card() -> None:
     )
 
     if uploaded_file is not None:
+        # server.maxUploadSize already refuses oversize files in the browser;
+        # this is the fallback, and UploadedFile.size needs no I/O
+        file_size_mb = uploaded_file.size / (1024 * 1024)
+
         # Validate file size
-        file_size_mb = len(uploaded_file.getvalue()) / (1024 * 1024)
 
         if file_size_mb > MAX_FILE_SIZE_MB:
             st.error(f"⚠️ File too large: {file_size_mb:.2f} MB")
@@ -131,12 +167,11 @@ def render_upload_card() -> None:
             st.caption(
                 f"📄 {st.session_state.document_info.get('filename', 'Document uploaded')}"
             )
-            file_size = (
-                st.session_state.document_info.get("size", 0) / 1024
-                if st.session_state.document_info.get("size")
-                else file_size_mb
+            file_size_kb = (
+                st.session_state.document_info.get("file_size", 0) / 1024
+                or file_size_mb * 1024
             )
-            st.caption(f"{file_size:.1f} KB")
+            st.caption(f"{file_size_kb:.1f} KB")
     elif st.session_state.document_info:
         st.success("✓ Ready to Verify")
         st.caption(
@@ -190,8 +225,8 @@ def render_chunking_card() -> None:
 def render_verify_card() -> None:
     """Render Card 3: AI Verification with Gemini branding
 
-    Uses @st.fragment to isolate reruns - only this card updates during verification,
-    preventing Step 4 from disappearing due to blocking HTTP calls.
+    Uses @st.fragment to isolate reruns; the verification call itself runs in a
+    background thread so the rest of the page stays interactive while it waits.
     """
     if st.session_state.verification_complete:
         st.success("✅ Verification complete")
@@ -227,41 +262,73 @@ def render_verify_card() -> None:
 
     # Process verification when button is clicked (only once per click)
     if verify_clicked and not is_processing:
-        # Set processing flag immediately to prevent double-execution
-        st.session_state.verification_in_progress = True
-
-        # Create progress indicators
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-
-        # Start verification
-        status_text.text("🔷 Gemini is verifying...")
-        progress_bar.progress(30)
-
-        result = execute_verification(
-            document_id=st.session_state.document_id,
-            store_id=st.session_state.store_id,
-            case_context=st.session_state.case_context,
-            splitting_mode=st.session_state.splitting_mode,
-        )
+        start_verification()
+        # Full rerun so the button and the other cards pick up the in-progress state
+        st.rerun()
+
+    if st.session_state.get("verify_future") is not None:
+        render_verification_status()
+    if st.session_state.get("verification_error"):
+        st.error(st.session_state.verification_error)
+        st.session_state.verification_error = None
+
+
+def start_verification() -> None:
+    """Submit the verification call to the background pool"""
+    # Set processing flag immediately to prevent double-execution
+    st.session_state.verification_in_progress = True
+    st.session_state.verify_started_at = time.monotonic()
+    st.session_state.verify_future = get_verify_pool().submit(
+        execute_verification,
+        document_id=st.session_state.document_id,
+        store_id=st.session_state.store_id,
+        case_context=st.session_state.case_context,
+        splitting_mode=st.session_state.splitting_mode,
+    )
+    cprint("[FRONTEND] Started background verification", "cyan")
 
-        if result:
-            st.session_state.verification_complete = True
-            st.session_state.verification_results = result
-            st.session_state.verification_in_progress = False
 
-            progress_bar.progress(100)
-            status_text.success("✅ Verification complete!")
-            # Force full page rerun so results section can display verification data
-            st.rerun()
-        else:
-            st.session_state.verification_in_progress = False
-            progress_bar.empty()
-            status_text.empty()
+@st.fragment(run_every=VERIFY_POLL_INTERVAL)
+def render_verification_status() -> None:
+    """Poll the background verification; only this fragment reruns while it runs
+
+    The verification resets clear verify_future, so a call still running when
+    the user starts over is dropped rather than applied to the new state.
+    """
+    future = st.session_state.get("verify_future")
+    if future is None:
+        return
+
+    if not future.done():
+        elapsed = int(time.monotonic() - st.session_state.verify_started_at)
+        st.caption(f"🔷 Gemini is verifying... ({elapsed}s)")
+        return
+
+    st.session_state.verify_future = None
+    st.session_state.verification_in_progress = False
+    try:
+        result = future.result()
+    except BackendError as e:
+        # The worker thread can't render, so keep its message for the card
+        st.session_state.verification_error = str(e)
+    else:
+        st.session_state.verification_complete = True
+        st.session_state.verification_results = result
+        # Derived counts are fixed for this run; compute them once, not per rerun
+        st.session_state.verification_summary = summarize_verification(result)
 
+    # Force full page rerun so results section can display verification data
+    # and the other cards re-enable their controls
+    st.rerun(scope="app")
 
+
+@st.fragment
 def render_export_card() -> None:
-    """Render Card 4: Output format and export"""
+    """Render Card 4: Output format and export
+
+    Uses @st.fragment so choosing a format or generating an export reruns only
+    this card instead of the whole page.
+    """
     if not st.session_state.document_info:
         st.caption("Export split and verified content")
         return
@@ -271,7 +338,7 @@ def render_export_card() -> None:
     output_format = st.selectbox(
         "Output Format",
         options=list(OUTPUT_FORMAT_LABELS.keys()),
-        format_func=lambda x: OUTPUT_FORMAT_LABELS[x].split(" - ")[0],  # Shorter labels
+        format_func=OUTPUT_FORMAT_SHORT_LABELS.get,  # Shorter labels
         help="Select output format",
         label_visibility="collapsed",
         disabled=st.session_state.verification_in_progress,
@@ -324,14 +391,21 @@ def render_export_card() -> None:
                             "mime_type": MIME_TYPES[output_format],
                             "format": output_format,
                         }
-                        st.rerun()
+                        # Only this card shows the export, so a fragment rerun is enough
+                        st.rerun(scope="fragment")
                 elif export_result:
                     st.error("⚠️ Export failed")
 
 
+@st.fragment
 def render_results_section() -> None:
-    """Render results section below verification cards"""
-    if not st.session_state.verification_complete:
+    """Render results section below verification cards
+
+    Uses @st.fragment so a Reset Verification click reruns only this section;
+    the full-page rerun happens once, from st.rerun() after the reset succeeds.
+    """
+    summary = st.session_state.get("verification_summary")
+    if not summary:
         return
 
     st.divider()
@@ -339,53 +413,40 @@ def render_results_section() -> None:
 
     results = st.session_state.verification_results
 
-    # Metrics row
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Total Chunks", results.get("total_chunks", 0))
-    with col2:
-        verified_count = results.get("total_verified", 0)
-        total_count = results.get("total_chunks", 0)
-        verified_pct = (verified_count / total_count * 100) if total_count > 0 else 0
-        st.metric("Verified", f"{verified_count}", f"{verified_pct:.1f}%")
-    with col3:
-        # Calculate average confidence
-        scores = [
-            c.get("verification_score", 0)
-            for c in results.get("verified_chunks", [])
-            if c.get("verified") and c.get("verification_score")
-        ]
-        avg_score = sum(scores) / len(scores) if scores else 0
-        st.metric("Avg Confidence", f"{avg_score:.1f}/10")
-    with col4:
-        st.metric("Time", f"{results.get('processing_time_seconds', 0):.1f}s")
-
-    st.divider()
-
-    # Confidence breakdown
-    scores_exist = bool(scores)
-    if scores_exist:
-        low_confidence = sum(1 for s in scores if s < 5)
-        medium_confidence = sum(1 for s in scores if 5 <= s < 8)
-        high_confidence = sum(1 for s in scores if s >= 8)
+    if summary["total"] == 0:
+        # Nothing was split out of the document, so skip the metric widgets
+        st.info("No chunks to summarize.")
+    else:
+        # Metrics row
+        col1, col2, col3, col4 = st.columns(4)
 
-        st.markdown("**Confidence Distribution:**")
-        col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("🔴 Low (<5)", low_confidence)
+            st.metric("Total Chunks", summary["total"])
         with col2:
-            st.metric("🟡 Medium (5-7)", medium_confidence)
+            st.metric("Verified", f"{summary['verified']}", f"{summary['verified_pct']:.1f}%")
         with col3:
-            st.metric("🟢 High (8-10)", high_confidence)
+            st.metric("Avg Confidence", f"{summary['avg_score']:.1f}/10")
+        with col4:
+            st.metric("Time", f"{results.get('processing_time_seconds', 0):.1f}s")
+
+        st.divider()
+
+        # Confidence breakdown
+        low_confidence, medium_confidence, high_confidence = summary["buckets"]
+        if low_confidence or medium_confidence or high_confidence:
+            st.markdown("**Confidence Distribution:**")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("🔴 Low (<5)", low_confidence)
+            with col2:
+                st.metric("🟡 Medium (5-7)", medium_confidence)
+            with col3:
+                st.metric("🟢 High (8-10)", high_confidence)
 
     # Reset verification button
     st.divider()
     col1, col2, col3 = st.columns([2, 1, 2])
     with col2:
-        from app.api_client import reset_verification
-        from app.state import reset_verification_state
-
         if st.button(
             "🔄 Reset Verification",
             type="secondary",
@@ -419,15 +480,13 @@ def main() -> None:
     # Render header
     render_header()
 
-    # Check backend (only show if unhealthy)
-    from app.api_client import check_backend_health
-
-    if not check_backend_health():
+    # Check backend (only show if unhealthy); checked once per run and
+    # passed to the footer rather than looked up again
+    backend_healthy = check_backend_health()
+    if not backend_healthy:
         st.error(
             "⚠️ Backend API is not available. Please ensure the backend is running."
         )
-        from app.config import BACKEND_URL
-
         st.code(f"Expected backend at: {BACKEND_URL}", language="text")
         st.stop()
 
@@ -461,11 +520,13 @@ def main() -> None:
     render_sidebar()
 
     # Footer
-    render_footer()
+    render_footer(backend_healthy)
 
 
 def render_verification_workflow() -> None:
     """Render the 4-card verification workflow"""
+    load_card_css()
+
     # Create 4 horizontal cards
     col1, col2, col3, col4 = st.columns(4)
 
@@ -524,5 +585,5 @@ if __name__ == "__main__":
         logger.error(f"Uncaught exception in main: {e}")
 
         # Show details in debug mode
-        if os.getenv("DEBUG", "false").lower() == "true":
+        if DEBUG:
             st.exception(e)
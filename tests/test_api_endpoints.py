@@ -5,10 +5,12 @@ Tests all API routes and request/response handling
 
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
+from app.main import app, DOCUMENT_UPLOADS
 from app.models import ChunkingMode, OutputFormat
 from termcolor import cprint
 import io
+import hashlib
+import gzip
 
 
 @pytest.fixture(scope="module")
@@ -117,6 +119,347 @@ class TestUploadEndpoint:
 
         cprint("[TEST] ✓ Invalid file rejected as expected", "green")
 
+    def test_upload_lookup_by_digest(self, test_client, sample_docx_content):
+        """Test that an uploaded document can be found again by content digest"""
+        cprint("\n[TEST] Testing upload lookup by content digest", "cyan")
+
+        digest = hashlib.sha256(sample_docx_content).hexdigest()
+
+        files = {
+            "file": (
+                "test.docx",
+                io.BytesIO(sample_docx_content),
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            )
+        }
+        upload_response = test_client.post("/upload", files=files)
+        assert upload_response.status_code == 200
+
+        response = test_client.get(f"/upload/{digest}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["document_id"] == upload_response.json()["document_id"]
+        assert data["filename"] == "test.docx"
+
+        cprint("[TEST] ✓ Stored document found by digest", "green")
+
+    def test_upload_lookup_unknown_digest(self, test_client):
+        """Test lookup with a digest that was never uploaded"""
+        cprint("\n[TEST] Testing upload lookup with unknown digest", "cyan")
+
+        response = test_client.get(f"/upload/{'0' * 64}")
+
+        assert response.status_code == 404
+
+        cprint("[TEST] ✓ Unknown digest returns 404", "green")
+
+    def test_upload_gzip_encoded(self, test_client, sample_docx_content):
+        """Test upload of a gzip-compressed file part"""
+        cprint("\n[TEST] Testing gzip-encoded upload", "cyan")
+
+        files = {
+            "file": (
+                "test.docx",
+                io.BytesIO(gzip.compress(sample_docx_content)),
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            )
+        }
+        response = test_client.post(
+            "/upload", files=files, data={"content_encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["file_size"] == len(sample_docx_content)
+
+        cprint("[TEST] ✓ Gzip upload decoded before conversion", "green")
+
+    def test_upload_unsupported_encoding(self, test_client, sample_docx_content):
+        """Test upload with an unknown content encoding"""
+        cprint("\n[TEST] Testing upload with unsupported encoding", "cyan")
+
+        files = {"file": ("test.docx", io.BytesIO(sample_docx_content))}
+        response = test_client.post(
+            "/upload", files=files, data={"content_encoding": "compress"}
+        )
+
+        assert response.status_code == 400
+
+        cprint("[TEST] ✓ Unsupported encoding rejected", "green")
+
+
+@pytest.mark.integration
+class TestDocumentChunkUpload:
+    """Test suite for chunked document upload endpoints"""
+
+    def test_upload_document_chunks(self, test_client, sample_docx_content):
+        """Test that parts sent out of order complete into a converted document"""
+        cprint("\n[TEST] Testing chunked document upload", "cyan")
+
+        payload = gzip.compress(sample_docx_content)
+        total = len(payload)
+        half = total // 2
+        for offset, part in [(half, payload[half:]), (0, payload[:half])]:
+            response = test_client.post(
+                "/upload/chunk",
+                data={
+                    "upload_id": "test-chunked-document",
+                    "filename": "test.docx",
+                    "offset": offset,
+                    "total": total,
+                },
+                files={"chunk": ("blob", io.BytesIO(part))},
+            )
+            assert response.status_code == 200
+
+        assert response.json()["received_bytes"] == total
+
+        response = test_client.post(
+            "/upload/complete",
+            json={"upload_id": "test-chunked-document", "content_encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["filename"] == "test.docx"
+        assert data["file_size"] == len(sample_docx_content)
+        assert data["document_id"] == hashlib.md5(sample_docx_content).hexdigest()
+        assert "test-chunked-document" not in DOCUMENT_UPLOADS
+
+        cprint("[TEST] ✓ Chunked document converted", "green")
+
+    def test_complete_retry_after_failure(self, test_client, sample_docx_content):
+        """Test that a failed completion leaves the upload staged for a retry"""
+        cprint("\n[TEST] Testing completion retry after a failure", "cyan")
+
+        payload = gzip.compress(sample_docx_content)
+        test_client.post(
+            "/upload/chunk",
+            data={
+                "upload_id": "test-retried-document",
+                "filename": "test.docx",
+                "offset": 0,
+                "total": len(payload),
+            },
+            files={"chunk": ("blob", io.BytesIO(payload))},
+        )
+
+        response = test_client.post(
+            "/upload/complete",
+            json={"upload_id": "test-retried-document", "content_encoding": "compress"},
+        )
+        assert response.status_code == 400
+
+        response = test_client.post(
+            "/upload/complete",
+            json={"upload_id": "test-retried-document", "content_encoding": "gzip"},
+        )
+        assert response.status_code == 200
+
+        cprint("[TEST] ✓ Completion retried with the same upload ID", "green")
+
+    def test_complete_unknown_upload(self, test_client):
+        """Test completing an upload ID that was never started"""
+        cprint("\n[TEST] Testing completion with unknown upload ID", "cyan")
+
+        response = test_client.post(
+            "/upload/complete", json={"upload_id": "never-uploaded"}
+        )
+
+        assert response.status_code == 404
+
+        cprint("[TEST] ✓ Unknown upload ID returns 404", "green")
+
+    def test_complete_incomplete_upload(self, test_client):
+        """Test completing before every part has arrived"""
+        cprint("\n[TEST] Testing completion with incomplete upload", "cyan")
+
+        test_client.post(
+            "/upload/chunk",
+            data={
+                "upload_id": "test-incomplete-document",
+                "filename": "test.docx",
+                "offset": 0,
+                "total": 100,
+            },
+            files={"chunk": ("blob", io.BytesIO(b"x" * 10))},
+        )
+
+        response = test_client.post(
+            "/upload/complete", json={"upload_id": "test-incomplete-document"}
+        )
+
+        assert response.status_code == 400
+        assert "test-incomplete-document" not in DOCUMENT_UPLOADS
+
+        cprint("[TEST] ✓ Incomplete upload rejected", "green")
+
+    def test_complete_overlapping_chunks(self, test_client):
+        """Test that overlapping parts adding up to the total are not accepted"""
+        cprint("\n[TEST] Testing completion with overlapping parts", "cyan")
+
+        for offset in (0, 1):
+            test_client.post(
+                "/upload/chunk",
+                data={
+                    "upload_id": "test-overlapping-document",
+                    "filename": "test.docx",
+                    "offset": offset,
+                    "total": 6,
+                },
+                files={"chunk": ("blob", io.BytesIO(b"abc"))},
+            )
+
+        response = test_client.post(
+            "/upload/complete", json={"upload_id": "test-overlapping-document"}
+        )
+
+        assert response.status_code == 400
+
+        cprint("[TEST] ✓ Overlapping parts rejected", "green")
+
+    def test_abandoned_upload_swept(self, test_client):
+        """Test that starting an upload discards staged uploads past their TTL"""
+        cprint("\n[TEST] Testing sweep of abandoned chunked uploads", "cyan")
+
+        chunk_request = {
+            "filename": "test.docx",
+            "offset": 0,
+            "total": 100,
+        }
+        test_client.post(
+            "/upload/chunk",
+            data={"upload_id": "test-abandoned-document", **chunk_request},
+            files={"chunk": ("blob", io.BytesIO(b"x" * 10))},
+        )
+        DOCUMENT_UPLOADS["test-abandoned-document"]["started_at"] = 0
+
+        test_client.post(
+            "/upload/chunk",
+            data={"upload_id": "test-fresh-document", **chunk_request},
+            files={"chunk": ("blob", io.BytesIO(b"x" * 10))},
+        )
+
+        assert "test-abandoned-document" not in DOCUMENT_UPLOADS
+        assert "test-fresh-document" in DOCUMENT_UPLOADS
+
+        cprint("[TEST] ✓ Abandoned upload discarded", "green")
+
+
+@pytest.mark.integration
+class TestReferenceChunkUpload:
+    """Test suite for chunked reference document upload endpoints"""
+
+    def test_upload_reference_chunks(self, test_client, sample_document_content):
+        """Test that chunks accumulate towards the file total"""
+        cprint("\n[TEST] Testing chunked reference upload", "cyan")
+
+        total = len(sample_document_content)
+        half = total // 2
+        for offset, part in [
+            (0, sample_document_content[:half]),
+            (half, sample_document_content[half:]),
+        ]:
+            response = test_client.post(
+                "/api/verify/upload-references/chunk",
+                data={
+                    "upload_id": "test-chunked-upload",
+                    "filename": "reference.pdf",
+                    "offset": offset,
+                    "total": total,
+                },
+                files={"chunk": ("blob", io.BytesIO(part))},
+            )
+            assert response.status_code == 200
+
+        data = response.json()
+        assert data["received_bytes"] == total
+        assert data["total_bytes"] == total
+
+        cprint("[TEST] ✓ Chunks received in full", "green")
+
+    def test_upload_reference_chunk_out_of_bounds(self, test_client):
+        """Test that a chunk past the declared total is rejected"""
+        cprint("\n[TEST] Testing out-of-bounds reference chunk", "cyan")
+
+        response = test_client.post(
+            "/api/verify/upload-references/chunk",
+            data={
+                "upload_id": "test-out-of-bounds",
+                "filename": "reference.pdf",
+                "offset": 8,
+                "total": 10,
+            },
+            files={"chunk": ("blob", io.BytesIO(b"too many bytes"))},
+        )
+
+        assert response.status_code == 400
+
+        cprint("[TEST] ✓ Out-of-bounds chunk rejected", "green")
+
+    def test_finalize_unknown_upload(self, test_client):
+        """Test finalizing an upload ID that was never started"""
+        cprint("\n[TEST] Testing finalize with unknown upload ID", "cyan")
+
+        response = test_client.post(
+            "/api/verify/upload-references/finalize",
+            json={"upload_ids": ["never-uploaded"], "case_context": None},
+        )
+
+        assert response.status_code == 404
+
+        cprint("[TEST] ✓ Unknown upload ID returns 404", "green")
+
+    def test_finalize_incomplete_upload(self, test_client):
+        """Test finalizing before every chunk has arrived"""
+        cprint("\n[TEST] Testing finalize with incomplete upload", "cyan")
+
+        test_client.post(
+            "/api/verify/upload-references/chunk",
+            data={
+                "upload_id": "test-incomplete-upload",
+                "filename": "reference.pdf",
+                "offset": 0,
+                "total": 100,
+            },
+            files={"chunk": ("blob", io.BytesIO(b"x" * 10))},
+        )
+
+        response = test_client.post(
+            "/api/verify/upload-references/finalize",
+            json={"upload_ids": ["test-incomplete-upload"]},
+        )
+
+        assert response.status_code == 400
+
+        cprint("[TEST] ✓ Incomplete upload rejected", "green")
+
+    def test_finalize_overlapping_chunks(self, test_client):
+        """Test that overlapping chunks adding up to the total are not accepted"""
+        cprint("\n[TEST] Testing finalize with overlapping chunks", "cyan")
+
+        for offset in (0, 1):
+            test_client.post(
+                "/api/verify/upload-references/chunk",
+                data={
+                    "upload_id": "test-overlapping-upload",
+                    "filename": "reference.pdf",
+                    "offset": offset,
+                    "total": 6,
+                },
+                files={"chunk": ("blob", io.BytesIO(b"abc"))},
+            )
+
+        response = test_client.post(
+            "/api/verify/upload-references/finalize",
+            json={"upload_ids": ["test-overlapping-upload"]},
+        )
+
+        assert response.status_code == 400
+
+        cprint("[TEST] ✓ Overlapping chunks rejected", "green")
+
 
 @pytest.mark.integration
 class TestChunkEndpoint:
@@ -429,6 +772,49 @@ class TestDownloadEndpoint:
 
         cprint(f"[TEST] ✓ File downloaded: {len(response.content)} bytes", "green")
 
+    def test_download_csv_gzip_encoded(self, test_client):
+        """Test that text exports are gzip-compressed when the client accepts it"""
+        cprint("\n[TEST] Testing gzip-encoded CSV download", "cyan")
+
+        from docx import Document
+
+        # Enough paragraphs that the CSV export clears GZIP_MINIMUM_SIZE (1 KB)
+        doc = Document()
+        for i in range(40):
+            doc.add_paragraph(
+                f"Paragraph {i}: The party agrees to deliver the goods described in schedule {i}."
+            )
+        buffer = io.BytesIO()
+        doc.save(buffer)
+
+        files = {
+            "file": (
+                "gzip-test.docx",
+                io.BytesIO(buffer.getvalue()),
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            )
+        }
+        upload_response = test_client.post("/upload", files=files)
+        document_id = upload_response.json()["document_id"]
+
+        export_request = {
+            "document_id": document_id,
+            "splitting_mode": ChunkingMode.PARAGRAPH.value,
+            "output_format": OutputFormat.CSV.value,
+        }
+        test_client.post("/export", json=export_request)
+
+        response = test_client.get(
+            f"/download/{document_id}", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        # The client decodes the body, so this is the uncompressed export size
+        assert len(response.content) > 1024
+
+        cprint("[TEST] ✓ CSV download negotiated gzip", "green")
+
     def test_download_nonexistent_document(self, test_client):
         """Test downloading from nonexistent document"""
         cprint("\n[TEST] Testing download from nonexistent document", "cyan")